@@ -23,7 +23,7 @@ def _seed_subtitle_materials(pool, project_id: str) -> None:  # noqa: ANN001
             id=0,
             text="a b",
             translation="甲乙",
-            asr_segment_ids=[0, 1],
+            asr_segment_ids=(0, 1),
             translation_chunks=[
                 TranslationChunk(text="甲", segment_id=0),
                 TranslationChunk(text="乙", segment_id=1),
@@ -55,7 +55,7 @@ def _seed_custom_subtitle_materials(
             id=0,
             text="a b",
             translation=translation,
-            asr_segment_ids=[0, 1],
+            asr_segment_ids=(0, 1),
             translation_chunks=chunks,
         )
     ]
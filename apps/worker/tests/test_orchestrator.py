@@ -167,7 +167,7 @@ class _NoopRepo:
         return []
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Runner:
     stage: StageName
     ctx_update: dict
@@ -188,7 +188,9 @@ class _Runner:
         ctx,  # noqa: ANN001
         progress_reporter=None,  # noqa: ANN001, ARG002
     ):
-        return {**dict(ctx), **dict(self.ctx_update)}, dict(self.artifacts)
+        out = ctx.copy()
+        out.update(self.ctx_update)
+        return out, dict(self.artifacts)
 
 
 async def test_orchestrator_runs_up_to_target_stage(tmp_path, monkeypatch) -> None:
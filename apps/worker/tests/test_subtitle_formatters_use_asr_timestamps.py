@@ -11,7 +11,7 @@ def test_srt_export_uses_asr_segment_timestamps_and_dual_line() -> None:
             id=0,
             text="hello",
             translation="你好",
-            asr_segment_ids=[2, 3],
+            asr_segment_ids=(2, 3),
             translation_chunks=[
                 TranslationChunk(text="你好", segment_id=2),
                 TranslationChunk(text="你好", segment_id=3),
@@ -42,7 +42,7 @@ def test_srt_export_uses_asr_segment_timestamps_and_dual_line() -> None:
 
 def test_srt_export_includes_filler_as_secondary_only() -> None:
     chunks = [
-        SemanticChunk(id=0, text="hello world", translation="你好世界", asr_segment_ids=[2, 3]),
+        SemanticChunk(id=0, text="hello world", translation="你好世界", asr_segment_ids=(2, 3)),
     ]
     asr_segments = [
         ASRSegment(id=0, start=0.0, end=1.2, text="嗯"),
@@ -77,7 +77,7 @@ def test_srt_export_primary_only_excludes_secondary_line() -> None:
             id=0,
             text="hello world",
             translation="你好世界",
-            asr_segment_ids=[0],
+            asr_segment_ids=(0,),
             translation_chunks=[TranslationChunk(text="你好世界", segment_id=0)],
         ),
     ]
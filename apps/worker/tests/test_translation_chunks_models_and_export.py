@@ -11,7 +11,7 @@ def test_semantic_chunk_serialization_roundtrip_translation_chunks() -> None:
             id=0,
             text="src",
             translation="dst",
-            asr_segment_ids=[0, 1],
+            asr_segment_ids=(0, 1),
             translation_chunks=[
                 TranslationChunk(text="A", segment_id=0),
                 TranslationChunk(text="B", segment_id=1),
@@ -48,7 +48,7 @@ def test_subtitle_exporter_per_chunk_leaves_uncovered_primary_empty() -> None:
             id=0,
             text="src",
             translation="FULL",
-            asr_segment_ids=[0, 1],
+            asr_segment_ids=(0, 1),
             translation_chunks=[TranslationChunk(text="only0", segment_id=0)],
         )
     ]
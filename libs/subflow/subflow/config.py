@@ -131,6 +131,12 @@ class ConcurrencyConfig(BaseSettings):
         validation_alias=AliasChoices("llm_fast", "CONCURRENCY_LLM_FAST"),
     )
     llm_power: int = Field(default=4, ge=1)
+    llm_fast_rpm: int = Field(
+        default=0, ge=0, description="Requests per minute for llm_fast (0 disables)."
+    )
+    llm_power_rpm: int = Field(
+        default=0, ge=0, description="Requests per minute for llm_power (0 disables)."
+    )
 
 
 class AudioConfig(BaseSettings):
@@ -34,6 +34,11 @@ class StageRunStatus(str, Enum):
     FAILED = "failed"
 
 
+_PROJECT_STATUS_BY_VALUE: dict[str, ProjectStatus] = {e.value: e for e in ProjectStatus}
+_STAGE_BY_VALUE: dict[str, StageName] = {e.value: e for e in StageName}
+_STAGE_RUN_STATUS_BY_VALUE: dict[str, StageRunStatus] = {e.value: e for e in StageRunStatus}
+
+
 def _utcnow() -> datetime:
     return datetime.now(tz=timezone.utc)
 
@@ -48,7 +53,7 @@ def _dt_from_iso(value: str | None) -> datetime | None:
     return datetime.fromisoformat(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class StageRun:
     stage: StageName
     status: StageRunStatus = StageRunStatus.PENDING
@@ -73,7 +78,7 @@ class StageRun:
             "duration_ms": self.duration_ms,
             "progress": self.progress,
             "progress_message": self.progress_message,
-            "metrics": dict(self.metrics) or None,
+            "metrics": dict(self.metrics) if self.metrics else None,
             "error_code": self.error_code,
             "error_message": self.error_message,
             "error": self.error,
@@ -90,9 +95,11 @@ class StageRun:
             duration_ms = int((completed_at - started_at).total_seconds() * 1000)
         metrics_raw = data.get("metrics")
         metrics = dict(metrics_raw) if isinstance(metrics_raw, dict) else {}
+        stage = str(data.get("stage", StageName.AUDIO_PREPROCESS.value))
+        status = str(data.get("status", StageRunStatus.PENDING.value))
         return cls(
-            stage=StageName(str(data.get("stage", StageName.AUDIO_PREPROCESS.value))),
-            status=StageRunStatus(str(data.get("status", StageRunStatus.PENDING.value))),
+            stage=_STAGE_BY_VALUE.get(stage) or StageName(stage),
+            status=_STAGE_RUN_STATUS_BY_VALUE.get(status) or StageRunStatus(status),
             started_at=started_at,
             completed_at=completed_at,
             duration_ms=int(duration_ms) if isinstance(duration_ms, int) else None,
@@ -107,7 +114,7 @@ class StageRun:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     id: str
     name: str
@@ -127,6 +134,20 @@ class Project:
     def touch(self) -> None:
         self.updated_at = _utcnow()
 
+    def get_stage_run(self, stage: StageName) -> StageRun | None:
+        for sr in self.stage_runs:
+            if sr.stage == stage:
+                return sr
+        return None
+
+    def set_stage_run(self, stage_run: StageRun) -> None:
+        runs = self.stage_runs
+        for i, sr in enumerate(runs):
+            if sr.stage == stage_run.stage:
+                runs[i] = stage_run
+                return
+        runs.append(stage_run)
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -140,15 +161,16 @@ class Project:
             "current_stage": int(self.current_stage),
             "artifacts": dict(self.artifacts),
             "stage_runs": [sr.to_dict() for sr in self.stage_runs],
-            "exports": [e.to_dict() for e in list(self.exports or [])],
+            "exports": [e.to_dict() for e in self.exports or ()],
             "created_at": _dt_to_iso(self.created_at),
             "updated_at": _dt_to_iso(self.updated_at),
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Project":
-        stage_runs_raw = list(data.get("stage_runs") or [])
-        exports_raw = list(data.get("exports") or [])
+        stage_runs_raw = data.get("stage_runs") or ()
+        exports_raw = data.get("exports") or ()
+        status = str(data.get("status") or ProjectStatus.PENDING.value)
         return cls(
             id=str(data.get("id", "")),
             name=str(data.get("name", "")),
@@ -157,7 +179,7 @@ class Project:
             source_language=data.get("source_language"),
             target_language=str(data.get("target_language") or "zh"),
             auto_workflow=bool(data.get("auto_workflow", True)),
-            status=ProjectStatus(str(data.get("status") or ProjectStatus.PENDING.value)),
+            status=_PROJECT_STATUS_BY_VALUE.get(status) or ProjectStatus(status),
             current_stage=int(data.get("current_stage") or 0),
             artifacts=dict(data.get("artifacts") or {}),
             stage_runs=[StageRun.from_dict(x) for x in stage_runs_raw if isinstance(x, dict)],
@@ -5,14 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class VADSegment:
     start: float
     end: float
     region_id: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ASRSegment:
     id: int
     start: float
@@ -76,5 +76,5 @@ class SemanticChunk:
     id: int
     text: str  # Corrected source text
     translation: str  # Full translation (produced in Pass 2)
-    asr_segment_ids: list[int] = field(default_factory=list)
+    asr_segment_ids: tuple[int, ...] = ()
     translation_chunks: list[TranslationChunk] = field(default_factory=list)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from subflow.models.segment import (
@@ -28,15 +29,17 @@ def _split_text_evenly(text: str, parts: int) -> list[str]:
     return out
 
 
+def _intern_language(value: Any) -> Any:
+    # Every segment of a transcript repeats the same few language codes.
+    return sys.intern(value) if type(value) is str else value
+
+
 def serialize_vad_regions(regions: list[VADSegment]) -> list[dict[str, float]]:
     return [{"start": float(r.start), "end": float(r.end)} for r in regions]
 
 
 def deserialize_vad_regions(items: list[dict[str, Any]]) -> list[VADSegment]:
-    out: list[VADSegment] = []
-    for item in items:
-        out.append(VADSegment(start=float(item["start"]), end=float(item["end"])))
-    return out
+    return [VADSegment(float(item["start"]), float(item["end"])) for item in items]
 
 
 def serialize_vad_segments(segs: list[VADSegment]) -> list[dict[str, float]]:
@@ -63,18 +66,16 @@ def serialize_asr_segments(segs: list[ASRSegment]) -> list[dict[str, Any]]:
 
 
 def deserialize_asr_segments(items: list[dict[str, Any]]) -> list[ASRSegment]:
-    out: list[ASRSegment] = []
-    for item in items:
-        out.append(
-            ASRSegment(
-                id=int(item["id"]),
-                start=float(item["start"]),
-                end=float(item["end"]),
-                text=str(item["text"]),
-                language=item.get("language"),
-            )
+    return [
+        ASRSegment(
+            int(item["id"]),
+            float(item["start"]),
+            float(item["end"]),
+            str(item["text"]),
+            _intern_language(item.get("language")),
         )
-    return out
+        for item in items
+    ]
 
 
 def serialize_asr_corrected_segments(
@@ -113,13 +114,13 @@ def serialize_semantic_chunks(items: list[SemanticChunk]) -> list[dict[str, Any]
             "id": int(c.id),
             "text": c.text,
             "translation": c.translation,
-            "asr_segment_ids": [int(x) for x in list(c.asr_segment_ids or [])],
+            "asr_segment_ids": [int(x) for x in c.asr_segment_ids or ()],
             "translation_chunks": [
                 {
                     "text": str(ch.text or ""),
                     "segment_id": int(ch.segment_id),
                 }
-                for ch in list(c.translation_chunks or [])
+                for ch in c.translation_chunks or ()
             ],
         }
         for c in items
@@ -129,7 +130,7 @@ def serialize_semantic_chunks(items: list[SemanticChunk]) -> list[dict[str, Any]
 def deserialize_semantic_chunks(items: list[dict[str, Any]]) -> list[SemanticChunk]:
     out: list[SemanticChunk] = []
     for item in items:
-        asr_segment_ids = [int(x) for x in list(item.get("asr_segment_ids") or [])]
+        asr_segment_ids = tuple(int(x) for x in item.get("asr_segment_ids") or ())
 
         translation_chunks: list[TranslationChunk] = []
         raw_chunks = item.get("translation_chunks")
@@ -151,8 +152,7 @@ def deserialize_semantic_chunks(items: list[dict[str, Any]]) -> list[SemanticChu
                 raw_ids = ch.get("segment_ids")
                 if not isinstance(raw_ids, list):
                     raw_ids = []
-                for seg_id in [int(x) for x in list(raw_ids or [])]:
-                    translation_chunks.append(TranslationChunk(text=text, segment_id=int(seg_id)))
+                translation_chunks.extend(TranslationChunk(text, int(x)) for x in raw_ids)
 
         # Backward compatibility: legacy artifacts may contain per-segment translations.
         if not translation_chunks:
@@ -180,10 +180,7 @@ def deserialize_semantic_chunks(items: list[dict[str, Any]]) -> list[SemanticChu
             ]
 
         if not asr_segment_ids and translation_chunks:
-            covered: set[int] = set()
-            for ch in translation_chunks:
-                covered.add(int(ch.segment_id))
-            asr_segment_ids = sorted(covered)
+            asr_segment_ids = tuple(sorted({int(ch.segment_id) for ch in translation_chunks}))
 
         out.append(
             SemanticChunk(
@@ -25,7 +25,7 @@ def _dt_from_iso(value: str | None) -> datetime | None:
     return datetime.fromisoformat(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleExport:
     id: str
     project_id: str
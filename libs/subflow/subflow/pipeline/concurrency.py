@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -17,14 +18,50 @@ class ConcurrencyState:
     max: int
 
 
+class RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per ``period`` seconds.
+
+    The bucket starts full, so up to ``rate`` requests may burst before callers are paced.
+    """
+
+    def __init__(self, rate: int, period: float = 60.0) -> None:
+        self.rate = max(1, int(rate))
+        self.period = float(period)
+        self._tokens = float(self.rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(float(self.rate), self._tokens + elapsed * self.rate / self.period)
+
+    async def acquire(self) -> None:
+        # Waiters queue on the lock so tokens are handed out in FIFO order.
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1.0:
+                await asyncio.sleep((1.0 - self._tokens) * self.period / self.rate)
+                self._refill()
+            self._tokens -= 1.0
+
+
 class ConcurrencyTracker:
-    def __init__(self, *, maxima: dict[ServiceType, int]) -> None:
+    def __init__(
+        self,
+        *,
+        maxima: dict[ServiceType, int],
+        rates: dict[ServiceType, int] | None = None,
+    ) -> None:
         self._lock = asyncio.Lock()
         self._active: dict[ServiceType, int] = {k: 0 for k in maxima}
         self._max: dict[ServiceType, int] = {k: max(1, int(v)) for k, v in maxima.items()}
         self._semaphores: dict[ServiceType, asyncio.Semaphore] = {
             k: asyncio.Semaphore(max(1, int(v))) for k, v in maxima.items()
         }
+        self._limiters: dict[ServiceType, RateLimiter] = {}
+        self.update_rates(rates or {})
 
     def update_maxima(self, maxima: dict[ServiceType, int]) -> None:
         for key, value in maxima.items():
@@ -35,9 +72,25 @@ class ConcurrencyTracker:
             if key not in self._semaphores or previous_max != normalized:
                 self._semaphores[key] = asyncio.Semaphore(normalized)
 
+    def update_rates(self, rates: dict[ServiceType, int]) -> None:
+        """Set requests-per-minute caps; a non-positive rate removes the limiter."""
+        for key, value in rates.items():
+            rpm = int(value)
+            if rpm <= 0:
+                self._limiters.pop(key, None)
+                continue
+            current = self._limiters.get(key)
+            if current is None or current.rate != rpm:
+                self._limiters[key] = RateLimiter(rpm, 60.0)
+
     def get_semaphore(self, service: ServiceType) -> asyncio.Semaphore:
         return self._semaphores[service]
 
+    def get_rate(self, service: ServiceType) -> int:
+        """Return the requests-per-minute cap for ``service`` (0 = unlimited)."""
+        limiter = self._limiters.get(service)
+        return limiter.rate if limiter is not None else 0
+
     async def snapshot(self, service: ServiceType) -> ConcurrencyState:
         async with self._lock:
             return ConcurrencyState(
@@ -48,6 +101,9 @@ class ConcurrencyTracker:
     async def acquire(self, service: ServiceType) -> AsyncIterator[ConcurrencyState]:
         sem = self._semaphores[service]
         async with sem:
+            limiter = self._limiters.get(service)
+            if limiter is not None:
+                await limiter.acquire()
             async with self._lock:
                 self._active[service] = int(self._active.get(service, 0)) + 1
                 state = ConcurrencyState(
@@ -67,17 +123,24 @@ _TRACKER: ConcurrencyTracker | None = None
 def get_concurrency_tracker(settings: Settings | None = None) -> ConcurrencyTracker:
     global _TRACKER
     maxima: dict[ServiceType, int]
+    rates: dict[ServiceType, int]
     if settings is not None:
         maxima = {
             "asr": int(settings.concurrency.asr),
             "llm_fast": int(settings.concurrency.llm_fast),
             "llm_power": int(settings.concurrency.llm_power),
         }
+        rates = {
+            "llm_fast": int(settings.concurrency.llm_fast_rpm),
+            "llm_power": int(settings.concurrency.llm_power_rpm),
+        }
     else:
         maxima = {"asr": 1, "llm_fast": 1, "llm_power": 1}
+        rates = {}
 
     if _TRACKER is None:
-        _TRACKER = ConcurrencyTracker(maxima=maxima)
+        _TRACKER = ConcurrencyTracker(maxima=maxima, rates=rates)
     else:
         _TRACKER.update_maxima(maxima)
+        _TRACKER.update_rates(rates)
     return _TRACKER
@@ -21,6 +21,8 @@ from subflow.models.segment import (
 
 
 class ProgressReporter(Protocol):
+    __slots__ = ()
+
     async def report(self, progress: int, message: str) -> None: ...
 
 
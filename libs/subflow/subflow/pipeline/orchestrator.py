@@ -39,18 +39,29 @@ logger = logging.getLogger(__name__)
 ProjectUpdateHook = Callable[[Project], Awaitable[None]]
 
 
-_STAGE_ORDER: list[StageName] = [
+_STAGE_ORDER: tuple[StageName, ...] = (
     StageName.AUDIO_PREPROCESS,
     StageName.VAD,
     StageName.ASR,
     StageName.LLM_ASR_CORRECTION,
     StageName.LLM,
-]
+)
 
 _STAGE_INDEX: dict[StageName, int] = {s: i + 1 for i, s in enumerate(_STAGE_ORDER)}
 
 
 class _StageRunProgressReporter(ProgressReporter):
+    __slots__ = (
+        "_last_progress",
+        "_last_update_at",
+        "_lock",
+        "_min_interval_s",
+        "_min_percent_step",
+        "_notify_update",
+        "_project",
+        "_stage_run",
+    )
+
     def __init__(
         self,
         *,
@@ -69,28 +80,24 @@ class _StageRunProgressReporter(ProgressReporter):
         self._last_progress = int(stage_run.progress or 0)
         self._last_update_at = 0.0
 
+    def _should_emit(self, pct: int, now: float) -> bool:
+        if pct >= 100 or pct >= self._last_progress + self._min_percent_step:
+            return True
+        return self._min_interval_s > 0 and now - self._last_update_at >= self._min_interval_s
+
     async def report(self, progress: int, message: str) -> None:
-        pct = int(progress)
-        if pct < 0:
-            pct = 0
-        if pct > 100:
-            pct = 100
+        pct = min(max(int(progress), 0), 100)
+        now = time.monotonic()
+        # Progress and the last emit time only move forward, so a report that is
+        # gated out here would also be gated out under the lock. Clamp first, as
+        # the locked path does, so e.g. a late report after 100 still emits.
+        if not self._should_emit(max(pct, self._last_progress), now):
+            return
         msg = str(message or "").strip() or "running"
 
-        now = time.monotonic()
         async with self._lock:
-            if pct < self._last_progress:
-                pct = self._last_progress
-
-            should_emit = False
-            if pct >= 100:
-                should_emit = True
-            elif pct >= self._last_progress + self._min_percent_step:
-                should_emit = True
-            elif self._min_interval_s > 0 and now - self._last_update_at >= self._min_interval_s:
-                should_emit = True
-
-            if not should_emit:
+            pct = max(pct, self._last_progress)
+            if not self._should_emit(pct, now):
                 return
 
             self._stage_run.progress = pct
@@ -104,12 +111,7 @@ class _StageRunProgressReporter(ProgressReporter):
         progress = payload.pop("progress", None)
         message = payload.pop("progress_message", None)
 
-        pct: int | None = int(progress) if isinstance(progress, int) else None
-        if pct is not None:
-            if pct < 0:
-                pct = 0
-            if pct > 100:
-                pct = 100
+        pct: int | None = min(max(int(progress), 0), 100) if isinstance(progress, int) else None
 
         msg: str | None = None
         if message is not None:
@@ -117,20 +119,8 @@ class _StageRunProgressReporter(ProgressReporter):
 
         now = time.monotonic()
         async with self._lock:
-            if pct is None:
-                pct = self._last_progress
-            elif pct < self._last_progress:
-                pct = self._last_progress
-
-            should_emit = False
-            if pct >= 100:
-                should_emit = True
-            elif pct >= self._last_progress + self._min_percent_step:
-                should_emit = True
-            elif self._min_interval_s > 0 and now - self._last_update_at >= self._min_interval_s:
-                should_emit = True
-
-            if not should_emit:
+            pct = self._last_progress if pct is None else max(pct, self._last_progress)
+            if not self._should_emit(pct, now):
                 return
 
             self._stage_run.progress = pct
@@ -283,14 +273,6 @@ class PipelineOrchestrator:
 
         return ctx
 
-    @staticmethod
-    def _upsert_stage_run(project: Project, stage_run: StageRun) -> None:
-        for i, sr in enumerate(list(project.stage_runs or [])):
-            if sr.stage == stage_run.stage:
-                project.stage_runs[i] = stage_run
-                return
-        project.stage_runs.append(stage_run)
-
     @staticmethod
     def _infer_current_stage_from_runs(stage_runs: list[StageRun]) -> int:
         by_stage: dict[StageName, StageRun] = {sr.stage: sr for sr in list(stage_runs or [])}
@@ -372,7 +354,7 @@ class PipelineOrchestrator:
         rollback_stage = max(0, target_index - 1)
         db_project.current_stage = min(int(db_project.current_stage), rollback_stage)
 
-        stages_to_reset = [s for s in _STAGE_ORDER if _STAGE_INDEX[s] >= target_index]
+        stages_to_reset = _STAGE_ORDER[target_index - 1 :]
         for s in stages_to_reset:
             if s == StageName.AUDIO_PREPROCESS:
                 await self.project_repo.update_media_files(db_project.id, {})
@@ -433,7 +415,7 @@ class PipelineOrchestrator:
                     error_message=None,
                 )
 
-        existing = next((sr for sr in list(project.stage_runs or []) if sr.stage == stage), None)
+        existing = project.get_stage_run(stage)
         if existing is not None and existing.status == StageRunStatus.FAILED:
             logger.info(
                 "orchestrator reset failed stage for retry (project_id=%s, stage=%s)",
@@ -454,18 +436,14 @@ class PipelineOrchestrator:
         )
         ctx = await self._hydrate_context(project)
 
-        for stage_name in _STAGE_ORDER:
+        for stage_name in _STAGE_ORDER[max(0, int(project.current_stage)) : target_index]:
             idx = _STAGE_INDEX[stage_name]
-            if idx <= project.current_stage:
-                continue
-            if idx > target_index:
-                break
-
             run = StageRun(stage=stage_name, status=StageRunStatus.RUNNING)
             run.started_at = datetime.now(tz=timezone.utc)
+            started_ns = time.monotonic_ns()
             run.progress = 0
             run.progress_message = "running"
-            self._upsert_stage_run(project, run)
+            project.set_stage_run(run)
             await self.stage_run_repo.mark_running(project.id, stage_name.value)
 
             async def _notify_progress(_project: Project) -> None:
@@ -526,37 +504,38 @@ class PipelineOrchestrator:
                 project.current_stage = idx
                 run.status = StageRunStatus.COMPLETED
                 run.completed_at = datetime.now(tz=timezone.utc)
-                if run.started_at is not None and run.completed_at is not None:
-                    run.duration_ms = int(
-                        (run.completed_at - run.started_at).total_seconds() * 1000
-                    )
+                run.duration_ms = (time.monotonic_ns() - started_ns) // 1_000_000
                 run.progress = 100
                 run.progress_message = "completed"
-                await self.stage_run_repo.mark_completed(
-                    project.id,
-                    stage_name.value,
-                    metadata={
-                        "duration_ms": run.duration_ms,
-                        "progress": 100,
-                        "progress_message": "completed",
-                        "output_artifacts": dict(artifacts),
-                        "metrics": dict(getattr(run, "metrics", {}) or {}),
-                    },
-                )
                 if stage_name == StageName.LLM:
                     project.status = ProjectStatus.COMPLETED
-                    await self.project_repo.update_status(
+                    status_update = self.project_repo.update_status(
                         project.id,
                         ProjectStatus.COMPLETED.value,
                         current_stage=project.current_stage,
                         error_message=None,
                     )
                 else:
-                    await self.project_repo.update_status(
+                    status_update = self.project_repo.update_status(
                         project.id,
                         ProjectStatus.PROCESSING.value,
                         current_stage=project.current_stage,
                     )
+                # The stage-run row and the project row are independent writes.
+                await asyncio.gather(
+                    self.stage_run_repo.mark_completed(
+                        project.id,
+                        stage_name.value,
+                        metadata={
+                            "duration_ms": run.duration_ms,
+                            "progress": 100,
+                            "progress_message": "completed",
+                            "output_artifacts": dict(artifacts),
+                            "metrics": dict(getattr(run, "metrics", {}) or {}),
+                        },
+                    ),
+                    status_update,
+                )
                 logger.info(
                     "stage done (project_id=%s, stage=%s, duration_ms=%s)",
                     project.id,
@@ -571,31 +550,30 @@ class PipelineOrchestrator:
                 )
                 run.status = StageRunStatus.FAILED
                 run.completed_at = datetime.now(tz=timezone.utc)
-                if run.started_at is not None and run.completed_at is not None:
-                    run.duration_ms = int(
-                        (run.completed_at - run.started_at).total_seconds() * 1000
-                    )
+                run.duration_ms = (time.monotonic_ns() - started_ns) // 1_000_000
                 run.error_code = self._infer_error_code(stage_name, exc)
                 run.error_message = self._infer_error_message(exc)
                 run.error = str(exc)
                 run.progress_message = "failed"
                 project.status = ProjectStatus.FAILED
-                await self.stage_run_repo.mark_failed(
-                    project.id,
-                    stage_name.value,
-                    run.error_code or ErrorCode.UNKNOWN.value,
-                    run.error_message or "failed",
-                    metadata={
-                        "duration_ms": run.duration_ms,
-                        "progress_message": "failed",
-                        "metrics": dict(getattr(run, "metrics", {}) or {}),
-                    },
-                )
-                await self.project_repo.update_status(
-                    project.id,
-                    ProjectStatus.FAILED.value,
-                    current_stage=project.current_stage,
-                    error_message=run.error_message,
+                await asyncio.gather(
+                    self.stage_run_repo.mark_failed(
+                        project.id,
+                        stage_name.value,
+                        run.error_code or ErrorCode.UNKNOWN.value,
+                        run.error_message or "failed",
+                        metadata={
+                            "duration_ms": run.duration_ms,
+                            "progress_message": "failed",
+                            "metrics": dict(getattr(run, "metrics", {}) or {}),
+                        },
+                    ),
+                    self.project_repo.update_status(
+                        project.id,
+                        ProjectStatus.FAILED.value,
+                        current_stage=project.current_stage,
+                        error_message=run.error_message,
+                    ),
                 )
                 await self._notify_update(project)
                 if isinstance(exc, StageExecutionError):
@@ -40,7 +40,7 @@ from subflow.stages import (
     VADStage,
 )
 from subflow.storage.artifact_store import ArtifactStore
-from subflow.utils.vad_frame_probs_io import encode_vad_frame_probs
+from subflow.utils.vad_frame_probs_io import write_vad_frame_probs
 
 logger = logging.getLogger(__name__)
 
@@ -296,11 +296,11 @@ class VADRunner(StageRunner):
         frame_probs = ctx.get("vad_frame_probs")
         hop_s = float(ctx.get("vad_frame_hop_s") or 0.0)
         if frame_probs is not None and hop_s > 0:
-            ident = await runner_ctx.store.save(
+            ident = await runner_ctx.store.save_from(
                 runner_ctx.project.id,
                 self.stage_name.value,
                 "vad_frame_probs.bin",
-                encode_vad_frame_probs(frame_probs=frame_probs, frame_hop_s=hop_s),
+                lambda fp: write_vad_frame_probs(fp, frame_probs=frame_probs, frame_hop_s=hop_s),
             )
             artifacts["vad_frame_probs.bin"] = ident
         return ctx, artifacts
@@ -375,7 +375,7 @@ class LLMRunner(StageRunner):
 
         max_asr = runner_ctx.settings.llm_limits.max_asr_segments
         if isinstance(max_asr, int) and max_asr > 0:
-            asr_segments_for_llm: list[ASRSegment] = list(ctx.get("asr_segments") or [])
+            asr_segments_for_llm: list[ASRSegment] = ctx.get("asr_segments") or []
             if len(asr_segments_for_llm) > max_asr:
                 ctx = cast(PipelineContext, dict(ctx))
                 selected = asr_segments_for_llm[:max_asr]
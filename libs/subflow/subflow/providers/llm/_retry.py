@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 
 from tenacity import RetryCallState, wait_exponential
 
@@ -12,6 +12,7 @@ from subflow.exceptions import ProviderError
 
 _WAIT_NORMAL = wait_exponential(min=1, max=10)
 _WAIT_RATE_LIMIT = wait_exponential(min=2, max=30)
+_MAX_RETRY_AFTER_S = 60.0
 
 
 class RetryableLLMError(ProviderError):
@@ -23,17 +24,36 @@ class RetryableLLMError(ProviderError):
         message: str,
         *,
         rate_limited: bool = False,
+        retry_after: float | None = None,
         error_code: ErrorCode | str | None = None,
     ) -> None:
         super().__init__(provider, message, error_code=error_code)
         self.rate_limited = bool(rate_limited)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Parse a delta-seconds ``Retry-After`` header (HTTP-date values are ignored)."""
+    if headers is None:
+        return None
+    raw = str(headers.get("retry-after") or "").strip()
+    if not raw:
+        return None
+    try:
+        value = float(raw)
+    except ValueError:
+        return None
+    return value if value >= 0 else None
 
 
 def wait_retry(state: RetryCallState) -> float:
     exc = state.outcome.exception() if state.outcome else None
     if isinstance(exc, RetryableLLMError) and exc.rate_limited:
-        return _WAIT_RATE_LIMIT(state)
-    return _WAIT_NORMAL(state)
+        backoff = float(_WAIT_RATE_LIMIT(state))
+        if exc.retry_after is not None:
+            return max(backoff, min(float(exc.retry_after), _MAX_RETRY_AFTER_S))
+        return backoff
+    return float(_WAIT_NORMAL(state))
 
 
 def log_retry(logger: logging.Logger) -> Callable[[RetryCallState], None]:
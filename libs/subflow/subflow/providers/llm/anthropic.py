@@ -26,7 +26,12 @@ from subflow.providers.llm.base import (
     ToolCallResult,
     ToolDefinition,
 )
-from subflow.providers.llm._retry import RetryableLLMError, log_retry, wait_retry
+from subflow.providers.llm._retry import (
+    RetryableLLMError,
+    log_retry,
+    parse_retry_after,
+    wait_retry,
+)
 from subflow.providers.llm._utils import build_usage, log_llm_call, parse_json_from_markdown
 
 logger = logging.getLogger(__name__)
@@ -35,31 +40,22 @@ DEFAULT_ANTHROPIC_BASE_URL = "https://api.anthropic.com"
 DEFAULT_MAX_TOKENS = 4096
 
 
-def _split_system_messages(messages: list[Message]) -> tuple[str | None, list[Message]]:
+def _split_system_messages(
+    messages: list[Message],
+) -> tuple[str | None, list[MessageParam]]:
+    """Split out system prompts and convert the rest to Anthropic params in one pass."""
     system_chunks: list[str] = []
-    non_system: list[Message] = []
+    out: list[MessageParam] = []
     for m in messages:
         role = str(m.role or "").strip().lower()
         if role == "system":
             if m.content:
                 system_chunks.append(str(m.content))
             continue
-        non_system.append(m)
-    system = "\n\n".join(system_chunks).strip() if system_chunks else ""
-    return (system or None), non_system
-
-
-def _to_anthropic_messages(messages: list[Message]) -> list[MessageParam]:
-    out: list[MessageParam] = []
-    for m in messages:
-        role = str(m.role or "").strip().lower()
-        typed_role: Literal["user", "assistant"]
-        if role == "assistant":
-            typed_role = "assistant"
-        else:
-            typed_role = "user"
+        typed_role: Literal["user", "assistant"] = "assistant" if role == "assistant" else "user"
         out.append({"role": typed_role, "content": str(m.content or "")})
-    return out
+    system = "\n\n".join(system_chunks).strip() if system_chunks else ""
+    return (system or None), out
 
 
 class AnthropicProvider(LLMProvider):
@@ -104,7 +100,7 @@ class AnthropicProvider(LLMProvider):
         temperature: float,
         max_tokens: int | None,
     ) -> tuple[str, LLMUsage | None, int]:
-        system, non_system = _split_system_messages(messages)
+        system, anthropic_messages = _split_system_messages(messages)
 
         started = time.perf_counter()
         text_chunks: list[str] = []
@@ -115,7 +111,7 @@ class AnthropicProvider(LLMProvider):
             # Use streaming mode for better proxy compatibility
             stream_kwargs: dict[str, Any] = {
                 "model": self.model,
-                "messages": _to_anthropic_messages(non_system),
+                "messages": anthropic_messages,
                 "temperature": float(temperature),
                 "max_tokens": int(max_tokens) if max_tokens is not None else DEFAULT_MAX_TOKENS,
             }
@@ -138,6 +134,7 @@ class AnthropicProvider(LLMProvider):
                 self.provider,
                 str(exc),
                 rate_limited=True,
+                retry_after=parse_retry_after(getattr(exc.response, "headers", None)),
                 error_code=ErrorCode.LLM_FAILED,
             ) from exc
         except anthropic.APIStatusError as exc:
@@ -245,12 +242,12 @@ class AnthropicProvider(LLMProvider):
         temperature: float,
         max_tokens: int | None,
     ) -> tuple[list[ToolCall], LLMUsage | None, int]:
-        system, non_system = _split_system_messages(messages)
+        system, anthropic_messages = _split_system_messages(messages)
         started = time.perf_counter()
         try:
             request: dict[str, Any] = {
                 "model": self.model,
-                "messages": _to_anthropic_messages(non_system),
+                "messages": anthropic_messages,
                 "temperature": float(temperature),
                 "max_tokens": int(max_tokens) if max_tokens is not None else DEFAULT_MAX_TOKENS,
             }
@@ -277,6 +274,7 @@ class AnthropicProvider(LLMProvider):
                 self.provider,
                 str(exc),
                 rate_limited=True,
+                retry_after=parse_retry_after(getattr(exc.response, "headers", None)),
                 error_code=ErrorCode.LLM_FAILED,
             ) from exc
         except anthropic.APIStatusError as exc:
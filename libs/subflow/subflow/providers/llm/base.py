@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """A chat message."""
 
@@ -13,20 +13,20 @@ class Message:
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMUsage:
     prompt_tokens: int | None = None
     completion_tokens: int | None = None
     total_tokens: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMCompletionResult:
     text: str
     usage: LLMUsage | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
     """Tool/Function definition (OpenAI-style JSON Schema parameters)."""
 
@@ -35,7 +35,7 @@ class ToolDefinition:
     parameters: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     """A single tool/function call returned by the model."""
 
@@ -44,7 +44,7 @@ class ToolCall:
     arguments: dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCallResult:
     """Tool use result (one request may contain multiple tool calls)."""
 
@@ -26,7 +26,12 @@ from subflow.providers.llm.base import (
     ToolCallResult,
     ToolDefinition,
 )
-from subflow.providers.llm._retry import RetryableLLMError, log_retry, wait_retry
+from subflow.providers.llm._retry import (
+    RetryableLLMError,
+    log_retry,
+    parse_retry_after,
+    wait_retry,
+)
 from subflow.providers.llm._utils import log_llm_call, parse_json_from_markdown
 
 logger = logging.getLogger(__name__)
@@ -34,20 +39,36 @@ logger = logging.getLogger(__name__)
 DEFAULT_OPENAI_BASE_URL = "https://api.openai.com/v1"
 
 
+def _sse_event_data(event: bytes) -> str | None:
+    data_lines = [line[5:].lstrip() for line in event.split(b"\n") if line.startswith(b"data:")]
+    if not data_lines:
+        return None
+    return b"\n".join(data_lines).decode("utf-8", errors="replace")
+
+
 async def _iter_sse_data(response: httpx.Response) -> AsyncIterator[str]:
-    data_lines: list[str] = []
-    async for line in response.aiter_lines():
-        if not line:
-            if data_lines:
-                yield "\n".join(data_lines)
-                data_lines = []
-            continue
-        if line.startswith(":"):
-            continue
-        if line.startswith("data:"):
-            data_lines.append(line[5:].lstrip())
-    if data_lines:
-        yield "\n".join(data_lines)
+    # Split events on raw bytes and decode only the data payloads, instead of decoding the
+    # whole stream and re-splitting it into lines.
+    buf = bytearray()
+    async for chunk in response.aiter_bytes():
+        buf += chunk
+        if b"\r" in buf:
+            # Hold back a trailing CR: it may be the first half of a CRLF split across chunks.
+            held = buf.endswith(b"\r")
+            if held:
+                del buf[-1]
+            buf = bytearray(buf.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+            if held:
+                buf += b"\r"
+        while (end := buf.find(b"\n\n")) != -1:
+            data = _sse_event_data(bytes(buf[:end]))
+            del buf[: end + 2]
+            if data is not None:
+                yield data
+    if buf:
+        data = _sse_event_data(bytes(buf).replace(b"\r", b"\n"))
+        if data is not None:
+            yield data
 
 
 def _format_http_error(response: httpx.Response, body: bytes | None) -> str:
@@ -178,6 +199,7 @@ class OpenAICompatProvider(LLMProvider):
                             self.provider,
                             message,
                             rate_limited=response.status_code == 429,
+                            retry_after=parse_retry_after(response.headers),
                             error_code=ErrorCode.LLM_FAILED,
                         )
                     raise ProviderError(self.provider, message, error_code=ErrorCode.LLM_FAILED)
@@ -307,6 +329,7 @@ class OpenAICompatProvider(LLMProvider):
                             self.provider,
                             message,
                             rate_limited=response.status_code == 429,
+                            retry_after=parse_retry_after(response.headers),
                             error_code=ErrorCode.LLM_FAILED,
                         )
                     raise ProviderError(self.provider, message, error_code=ErrorCode.LLM_FAILED)
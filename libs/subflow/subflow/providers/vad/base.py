@@ -10,5 +10,9 @@ class VADProvider(ABC):
     def detect(self, audio_path: str) -> list[tuple[float, float]]:
         raise NotImplementedError
 
+    def warmup(self) -> None:
+        """Load model weights ahead of the first ``detect`` call (no-op by default)."""
+        return None
+
     async def close(self) -> None:  # pragma: no cover
         return None
@@ -8,6 +8,7 @@ This model is shipped as a NeMo `.nemo` checkpoint, so inference requires `nemo_
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -80,6 +81,18 @@ class NemoMarbleNetVADProvider(VADProvider):
         model.eval()
         self._model = model
 
+    def warmup(self) -> None:
+        self._ensure_loaded()
+
+    async def close(self) -> None:
+        """Drop the model so its (GPU) memory can be reclaimed; it reloads lazily."""
+        if self._model is None:
+            return
+        self._model = None
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
     @staticmethod
     def _merge_close_segments(
         segments: list[tuple[float, float]],
@@ -4,6 +4,7 @@ import json
 import logging
 from datetime import datetime, timezone
 import builtins
+from collections.abc import Iterable
 from typing import Any
 
 import psycopg
@@ -245,6 +246,24 @@ class ProjectRepository(BaseRepository):
                 rows = await cur.fetchall()
         return [str(row[0]) for row in rows]
 
+    async def list_missing_ids(self, ids: Iterable[str]) -> builtins.list[str]:
+        """Return the given IDs that have no project row (anti-join done in Postgres)."""
+        candidates = [str(project_id) for project_id in ids]
+        if not candidates:
+            return []
+        async with self.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    """
+                    SELECT c.id
+                    FROM unnest(%s::varchar[]) AS c(id)
+                    WHERE NOT EXISTS (SELECT 1 FROM projects p WHERE p.id = c.id)
+                    """,
+                    (candidates,),
+                )
+                rows = await cur.fetchall()
+        return [str(row[0]) for row in rows]
+
     async def list(self, limit: int = 100, offset: int = 0) -> builtins.list[Project]:
         async with self.connection() as conn:
             async with conn.cursor(row_factory=dict_row) as cur:
@@ -32,7 +32,7 @@ class SemanticChunkRepository(BaseRepository):
                                 str(chunk.translation or "")
                                 if chunk.translation is not None
                                 else None,
-                                [int(x) for x in list(chunk.asr_segment_ids or [])],
+                                [int(x) for x in chunk.asr_segment_ids or ()],
                             ),
                         )
                         row = await cur.fetchone()
@@ -115,7 +115,7 @@ class SemanticChunkRepository(BaseRepository):
                     id=int(r.get("chunk_index") or 0),
                     text=str(r.get("text") or ""),
                     translation=str(r.get("translation") or ""),
-                    asr_segment_ids=[int(x) for x in list(r.get("asr_segment_ids") or [])],
+                    asr_segment_ids=tuple(int(x) for x in r.get("asr_segment_ids") or ()),
                     translation_chunks=list(translations_by_semantic_id.get(sid, [])),
                 )
             )
@@ -206,26 +206,35 @@ class StageRunRepository(BaseRepository):
         message: str,
         metrics: dict[str, Any] | None = None,
     ) -> None:
+        delta = {
+            "progress": max(0, min(100, int(progress))),
+            "progress_message": str(message or "").strip() or "running",
+        }
+        # Merge the delta server-side instead of reading the whole metadata document back.
         async with self.connection() as conn:
-            async with conn.cursor(row_factory=dict_row) as cur:
-                await cur.execute(
-                    "SELECT metadata FROM stage_runs WHERE project_id=%s AND stage=%s",
-                    (project_id, str(stage)),
-                )
-                row = await cur.fetchone()
-                current = _as_dict(row.get("metadata") if row else None)
-                current["progress"] = max(0, min(100, int(progress)))
-                current["progress_message"] = str(message or "").strip() or "running"
-                if metrics:
-                    current_metrics = _as_dict(current.get("metrics"))
-                    current_metrics.update(dict(metrics))
-                    current["metrics"] = current_metrics
+            async with conn.cursor() as cur:
                 await cur.execute(
                     """
                     UPDATE stage_runs
-                    SET metadata=%s
-                    WHERE project_id=%s AND stage=%s
+                    SET metadata = COALESCE(metadata, '{}'::jsonb) || %(delta)s
+                      || CASE
+                        WHEN %(metrics)s::jsonb IS NULL THEN '{}'::jsonb
+                        ELSE jsonb_build_object(
+                          'metrics',
+                          CASE
+                            WHEN jsonb_typeof(metadata->'metrics') = 'object'
+                              THEN metadata->'metrics'
+                            ELSE '{}'::jsonb
+                          END || %(metrics)s::jsonb
+                        )
+                      END
+                    WHERE project_id=%(project_id)s AND stage=%(stage)s
                     """,
-                    (Jsonb(current), project_id, str(stage)),
+                    {
+                        "delta": Jsonb(delta),
+                        "metrics": Jsonb(dict(metrics)) if metrics else None,
+                        "project_id": project_id,
+                        "stage": str(stage),
+                    },
                 )
             await conn.commit()
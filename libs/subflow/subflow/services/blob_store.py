@@ -461,7 +461,6 @@ class BlobStore:
     def _gc_unreferenced_sync(self, limit: int, dry_run: bool) -> int:
         import psycopg
 
-        deleted = 0
         with psycopg.connect(self.settings.database_url, connect_timeout=1) as conn:
             with conn.cursor() as cur:
                 cur.execute(
@@ -475,19 +474,23 @@ class BlobStore:
                     (int(limit),),
                 )
                 hashes = [str(r[0]) for r in (cur.fetchall() or [])]
+                if dry_run:
+                    return len(hashes)
 
+                removed: list[str] = []
                 for h in hashes:
                     path = self.blob_path(h)
-                    if not dry_run:
-                        try:
-                            if path.exists():
-                                path.unlink()
-                        except Exception:
-                            continue
-
-                    if not dry_run:
-                        cur.execute("DELETE FROM file_blobs WHERE hash=%s AND ref_count <= 0", (h,))
-                    deleted += 1
-            if not dry_run:
-                conn.commit()
-        return deleted
+                    try:
+                        if path.exists():
+                            path.unlink()
+                    except Exception:
+                        continue
+                    removed.append(h)
+
+                if removed:
+                    cur.execute(
+                        "DELETE FROM file_blobs WHERE hash = ANY(%s) AND ref_count <= 0",
+                        (removed,),
+                    )
+            conn.commit()
+        return len(removed)
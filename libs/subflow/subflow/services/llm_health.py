@@ -12,8 +12,7 @@ import asyncio
 import json
 import os
 import time
-from collections import deque
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Coroutine, Literal
 
@@ -60,6 +59,36 @@ def _truncate_error(value: str, limit: int = 500) -> str:
     return s[:limit].rstrip() + "..."
 
 
+class _WindowCounter:
+    """Event count over the last ``window_s`` seconds using one bucket per second.
+
+    Memory is fixed at ``window_s`` buckets and recording an event is O(1), regardless of
+    call volume.
+    """
+
+    __slots__ = ("_counts", "_seconds", "_window_s")
+
+    def __init__(self, window_s: int = _WINDOW_S) -> None:
+        self._window_s = int(window_s)
+        self._counts = [0] * self._window_s
+        # Absolute second each bucket currently holds (-1 = never used).
+        self._seconds = [-1] * self._window_s
+
+    def add(self, ts: float) -> None:
+        sec = int(ts)
+        idx = sec % self._window_s
+        held = self._seconds[idx]
+        if held == sec:
+            self._counts[idx] += 1
+        elif sec > held:
+            self._seconds[idx] = sec
+            self._counts[idx] = 1
+
+    def count(self, now_ts: float) -> int:
+        cutoff = int(now_ts) - self._window_s
+        return sum(c for c, sec in zip(self._counts, self._seconds) if sec > cutoff)
+
+
 @dataclass
 class _ProfileState:
     provider: str | None = None
@@ -70,10 +99,6 @@ class _ProfileState:
     last_error: str | None = None
     last_latency_ms: int | None = None
 
-    # Sliding window events (in-memory only)
-    success_events: deque[float] = field(default_factory=deque)
-    error_events: deque[float] = field(default_factory=deque)
-
 
 @dataclass(frozen=True)
 class ProviderHealth:
@@ -132,6 +157,15 @@ class LLMHealthMonitor:
             "fast": _ProfileState(),
             "power": _ProfileState(),
         }
+        # Sliding window counters (in-memory only)
+        self._success_counts: dict[LLMProfile, _WindowCounter] = {
+            "fast": _WindowCounter(),
+            "power": _WindowCounter(),
+        }
+        self._error_counts: dict[LLMProfile, _WindowCounter] = {
+            "fast": _WindowCounter(),
+            "power": _WindowCounter(),
+        }
 
     def set_redis(self, redis: Redis | None) -> None:
         self._redis = redis
@@ -172,11 +206,6 @@ class LLMHealthMonitor:
             return "ok"
         return "error"
 
-    def _prune_deque(self, items: deque[float], now_ts: float) -> None:
-        cutoff = now_ts - float(_WINDOW_S)
-        while items and items[0] < cutoff:
-            items.popleft()
-
     async def report_success(
         self,
         *,
@@ -242,14 +271,11 @@ class LLMHealthMonitor:
         if ok:
             state.last_success_ts = now_ts
             state.last_error = None
-            state.success_events.append(now_ts)
+            self._success_counts[profile].add(now_ts)
         else:
             state.last_error_ts = now_ts
             state.last_error = error or "unknown error"
-            state.error_events.append(now_ts)
-
-        self._prune_deque(state.success_events, now_ts)
-        self._prune_deque(state.error_events, now_ts)
+            self._error_counts[profile].add(now_ts)
 
         redis = self._redis
         if redis is None:
@@ -312,13 +338,13 @@ class LLMHealthMonitor:
 
     async def _counts_1h(self, profile: LLMProfile) -> tuple[int, int]:
         now_ts = _ts()
-        state = self._states[profile]
 
         redis = self._redis
         if redis is None:
-            self._prune_deque(state.success_events, now_ts)
-            self._prune_deque(state.error_events, now_ts)
-            return len(state.success_events), len(state.error_events)
+            return (
+                self._success_counts[profile].count(now_ts),
+                self._error_counts[profile].count(now_ts),
+            )
 
         cutoff = now_ts - float(_WINDOW_S)
         success_key = self._events_key(profile, "success")
@@ -259,20 +259,19 @@ class SemanticChunkingPass(BaseLLMStage):
             batches.append(current)
         return batches
 
-    def _build_batch_user_input(
-        self,
-        *,
-        target_language: str,
-        global_context: dict[str, Any],
-        items: list[tuple[int, str]],
-    ) -> str:
+    @staticmethod
+    def _build_batch_user_header(*, target_language: str, global_context: dict[str, Any]) -> str:
+        """Build the prompt prefix shared by every batch (and retry) of one execution."""
         parts: list[str] = [f"目标语言：{target_language}"]
         compact_context = _compact_global_context(global_context)
         if compact_context:
             parts.append(f"全局上下文：\n{json.dumps(compact_context, ensure_ascii=False)}")
+        return "\n\n".join(parts)
+
+    @staticmethod
+    def _build_batch_user_input(*, header: str, items: list[tuple[int, str]]) -> str:
         payload = [{"id": int(seg_id), "text": str(text or "").strip()} for seg_id, text in items]
-        parts.append("待翻译：\n" + json.dumps(payload, ensure_ascii=False))
-        return "\n\n".join(parts).strip()
+        return f"{header}\n\n待翻译：\n{json.dumps(payload, ensure_ascii=False)}".strip()
 
     async def execute(
         self,
@@ -300,9 +299,18 @@ class SemanticChunkingPass(BaseLLMStage):
 
         ordered = sorted(asr_segments, key=lambda s: (float(s.start), float(s.end), int(s.id)))
 
-        def _src_text(seg: ASRSegment) -> str:
+        # Resolve each segment's (corrected) source text once; batching, prompts and the
+        # final assembly all look it up by id.
+        src_text_by_id: dict[int, str] = {}
+        for seg in ordered:
             corrected = corrected_map.get(int(seg.id))
-            return str((corrected.text if corrected is not None else seg.text) or "").strip()
+            src_text_by_id.setdefault(
+                int(seg.id),
+                str((corrected.text if corrected is not None else seg.text) or "").strip(),
+            )
+
+        def _src_text(seg: ASRSegment) -> str:
+            return src_text_by_id[int(seg.id)]
 
         translatable = [seg for seg in ordered if _src_text(seg)]
         total = len(translatable)
@@ -332,6 +340,9 @@ class SemanticChunkingPass(BaseLLMStage):
                 await progress_reporter.report(0, f"翻译中 0/{total} 段")
 
         system_prompt_tool_use = self._get_tool_use_system_prompt()
+        user_header = self._build_batch_user_header(
+            target_language=target_language, global_context=global_ctx
+        )
         batch_size = max(
             1, int(getattr(self.settings.llm_limits, "translation_batch_size", 10) or 10)
         )
@@ -511,8 +522,7 @@ class SemanticChunkingPass(BaseLLMStage):
                         len(request_items),
                     )
                     user_input = self._build_batch_user_input(
-                        target_language=target_language,
-                        global_context=global_ctx,
+                        header=user_header,
                         items=request_items,
                     )
 
@@ -678,9 +688,15 @@ class SemanticChunkingPass(BaseLLMStage):
             await _maybe_report()
             return all_results
 
-        results = await asyncio.gather(*[_translate_batch(batch) for batch in batches])
+        # TaskGroup cancels the remaining batches as soon as one fails (e.g. tool use is
+        # unsupported); in-flight LLM calls are still bounded by the concurrency tracker.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_translate_batch(batch)) for batch in batches]
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0]
         translation_by_id: dict[int, str] = {}
-        for mapping in results:
+        for mapping in (task.result() for task in tasks):
             for seg_id, tr in mapping.items():
                 if int(seg_id) not in translation_by_id:
                     translation_by_id[int(seg_id)] = str(tr or "").strip()
@@ -697,7 +713,7 @@ class SemanticChunkingPass(BaseLLMStage):
                     id=seg_id,
                     text=src,
                     translation=translation,
-                    asr_segment_ids=[seg_id],
+                    asr_segment_ids=(seg_id,),
                     translation_chunks=[],
                 )
             )
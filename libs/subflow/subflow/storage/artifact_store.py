@@ -4,15 +4,19 @@ from __future__ import annotations
 
 import asyncio
 import builtins
+import io
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from shutil import rmtree
-from typing import Any
+from typing import Any, BinaryIO
 
 logger = logging.getLogger(__name__)
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 
 class ArtifactStore(ABC):
     @abstractmethod
@@ -35,6 +39,11 @@ class ArtifactStore(ABC):
     async def list_project_ids(self) -> builtins.list[str]:
         """Return all project IDs that have artifacts."""
 
+    async def iter_project_ids(self) -> AsyncIterator[str]:
+        """Yield project IDs that have artifacts, without building the full list when possible."""
+        for project_id in await self.list_project_ids():
+            yield project_id
+
     async def get_presigned_url(
         self,
         project_id: str,
@@ -46,6 +55,22 @@ class ArtifactStore(ABC):
         """Return a presigned download URL when supported by the backend."""
         return None
 
+    async def save_from(
+        self,
+        project_id: str,
+        stage: str,
+        name: str,
+        writer: Callable[[BinaryIO], object],
+    ) -> str:
+        """Save an artifact produced by ``writer(fp)`` writing into a binary stream.
+
+        Backends that can stream (e.g. local files) override this to hand the
+        writer their own handle; the default buffers once and calls ``save``.
+        """
+        buf = io.BytesIO()
+        writer(buf)
+        return await self.save(project_id, stage, name, buf.getvalue())
+
     async def save_text(self, project_id: str, stage: str, name: str, text: str) -> str:
         return await self.save(project_id, stage, name, text.encode("utf-8"))
 
@@ -53,11 +78,10 @@ class ArtifactStore(ABC):
         return (await self.load(project_id, stage, name)).decode("utf-8")
 
     async def save_json(self, project_id: str, stage: str, name: str, obj: Any) -> str:
-        raw = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
-        return await self.save(project_id, stage, name, raw)
+        return await self.save(project_id, stage, name, _JSON_ENCODER.encode(obj).encode("utf-8"))
 
     async def load_json(self, project_id: str, stage: str, name: str) -> Any:
-        return json.loads(await self.load_text(project_id, stage, name))
+        return json.loads(await self.load(project_id, stage, name))
 
 
 class LocalArtifactStore(ArtifactStore):
@@ -77,6 +101,19 @@ class LocalArtifactStore(ArtifactStore):
         path.write_bytes(data)
         return str(path)
 
+    async def save_from(
+        self,
+        project_id: str,
+        stage: str,
+        name: str,
+        writer: Callable[[BinaryIO], object],
+    ) -> str:
+        path = self._path(project_id, stage, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as fp:
+            writer(fp)
+        return str(path)
+
     async def load(self, project_id: str, stage: str, name: str) -> bytes:
         path = self._path(project_id, stage, name)
         return path.read_bytes()
@@ -124,3 +161,14 @@ class LocalArtifactStore(ArtifactStore):
             return sorted([p.name for p in base.iterdir() if p.is_dir()])
         except Exception:
             return []
+
+    async def iter_project_ids(self) -> AsyncIterator[str]:
+        base = self.base_dir / "projects"
+        if not base.exists():
+            return
+        try:
+            for p in base.iterdir():
+                if p.is_dir():
+                    yield p.name
+        except OSError:
+            return
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import builtins
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from botocore.config import Config
@@ -200,3 +201,21 @@ class S3ArtifactStore(ArtifactStore):
         except ClientError as exc:
             logger.warning("s3 list_project_ids failed: %s", exc)
             return []
+
+    async def iter_project_ids(self) -> AsyncIterator[str]:
+        client = self._ensure_client()
+        await self._ensure_bucket()
+
+        pages = iter_list_objects_v2(client, bucket=self.bucket, Prefix="projects/", Delimiter="/")
+        while True:
+            try:
+                resp = await asyncio.to_thread(next, pages, None)
+            except ClientError as exc:
+                logger.warning("s3 iter_project_ids failed: %s", exc)
+                return
+            if resp is None:
+                return
+            for prefix in resp.get("CommonPrefixes") or []:
+                parts = str(prefix.get("Prefix") or "").strip("/").split("/")
+                if len(parts) >= 2 and parts[0] == "projects":
+                    yield parts[1]
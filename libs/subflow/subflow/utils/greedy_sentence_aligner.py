@@ -9,6 +9,7 @@ This module implements a lightweight PoC algorithm:
 
 from __future__ import annotations
 
+from array import array
 from collections.abc import Awaitable, Callable, Iterable, Sequence
 from dataclasses import dataclass
 import re
@@ -171,15 +172,22 @@ def split_clause_by_max_units(
     return (clause, remaining)
 
 
-def _probs_to_list(frame_probs: Sequence[float] | object) -> list[float]:
+def frame_probs_as_array(frame_probs: Sequence[float] | object) -> Sequence[float]:
+    """Materialize frame probs once as a packed float array (lists/arrays pass through).
+
+    Tensors/ndarrays are converted in one ``tolist()`` call; convert once per audio and
+    reuse the result instead of re-converting for every valley search.
+    """
+    if isinstance(frame_probs, (list, array)):
+        return frame_probs
     tolist = getattr(frame_probs, "tolist", None)
     if callable(tolist):
         values = tolist()
         if isinstance(values, list):
-            return [float(v) for v in values]
+            return array("d", values)
     if isinstance(frame_probs, Iterable):
-        return [float(v) for v in frame_probs]
-    return []
+        return array("d", (float(v) for v in frame_probs))
+    return array("d")
 
 
 def find_vad_valley(
@@ -197,7 +205,7 @@ def find_vad_valley(
     if max_time <= min_time:
         return float(max_time)
 
-    probs = _probs_to_list(frame_probs)
+    probs = frame_probs_as_array(frame_probs)
     if not probs or frame_hop_s <= 0:
         return float(max_time)
 
@@ -284,6 +292,7 @@ async def greedy_sentence_align_region(
     if end <= start:
         return []
 
+    frame_probs = frame_probs_as_array(frame_probs)
     max_seg_s = float(cfg.max_segment_s)
     segments: list[SentenceAlignedSegment] = []
     cursor = start
@@ -400,6 +409,7 @@ async def greedy_sentence_align(
     frame_hop_s: float,
     config: GreedySentenceAlignerConfig | None = None,
 ) -> list[SentenceAlignedSegment]:
+    frame_probs = frame_probs_as_array(frame_probs)
     out: list[SentenceAlignedSegment] = []
     for region_start, region_end in vad_regions:
         out.extend(
@@ -8,6 +8,8 @@ import re
 
 logger = logging.getLogger(__name__)
 
+_JSON_FRAGMENT_RE = re.compile(r"(\{[^{}]*\}|\[[^\[\]]*\])")
+
 
 def repair_truncated_json(text: str) -> str:
     """Attempt to repair a truncated JSON string.
@@ -107,7 +109,7 @@ def parse_json_safe(raw: str) -> dict | list | None:
 
     # Try extracting just the object/array portion
     # Sometimes there's extra text before/after
-    match = re.search(r"(\{[^{}]*\}|\[[^\[\]]*\])", text)
+    match = _JSON_FRAGMENT_RE.search(text)
     if match:
         try:
             parsed = json.loads(match.group(1))
@@ -132,6 +134,15 @@ def parse_tool_arguments_safe(raw: str) -> dict | None:
     Returns:
         Parsed dict or None if unparseable
     """
+    # Fast path: complete streamed arguments are the common case and need no repair.
+    try:
+        parsed = json.loads(raw)
+    except (TypeError, json.JSONDecodeError):
+        pass
+    else:
+        if isinstance(parsed, dict):
+            return parsed
+
     result = parse_json_safe(raw)
     if isinstance(result, dict):
         return result
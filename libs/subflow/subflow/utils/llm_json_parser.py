@@ -1,38 +1,22 @@
 from __future__ import annotations
 
 import json
+import re
 
+# A whole line (plus its newline) whose stripped content starts with a ``` fence marker.
+_FENCE_LINE_RE = re.compile(r"^[^\S\n]*```[^\n]*(?:\n|\Z)", re.MULTILINE)
 
-def parse_id_text_array(raw_output: str, *, expected_ids: list[int]) -> dict[int, str]:
-    """Parse LLM output in [{"id": x, "text": "..."}] format."""
-    text = (raw_output or "").strip()
 
+def _strip_code_fences(raw_output: str) -> str:
+    text = (raw_output or "").strip()
     if text.startswith("```"):
-        lines = text.splitlines()
-        cleaned = [line for line in lines if not line.strip().startswith("```")]
-        text = "\n".join(cleaned).strip()
-
-    try:
-        data = json.loads(text)
-    except json.JSONDecodeError as exc:
-        raise ValueError(f"Invalid JSON: {exc}") from exc
+        text = _FENCE_LINE_RE.sub("", text).strip()
+    return text
 
-    if not isinstance(data, list):
-        raise ValueError(f"Expected JSON array, got {type(data).__name__}")
 
-    out: dict[int, str] = {}
-    for item in data:
-        if not isinstance(item, dict):
-            continue
-        raw_id = item.get("id")
-        if raw_id is None:
-            continue
-        try:
-            seg_id = int(raw_id)
-        except (TypeError, ValueError):
-            continue
-        if seg_id not in out:
-            out[seg_id] = str(item.get("text") or "").strip()
+def parse_id_text_array(raw_output: str, *, expected_ids: list[int]) -> dict[int, str]:
+    """Parse LLM output in [{"id": x, "text": "..."}] format."""
+    out = parse_id_text_array_partial(raw_output)
 
     missing = [int(i) for i in expected_ids if int(i) not in out]
     if missing:
@@ -43,12 +27,7 @@ def parse_id_text_array(raw_output: str, *, expected_ids: list[int]) -> dict[int
 
 def parse_id_text_array_partial(raw_output: str) -> dict[int, str]:
     """Best-effort parse for [{"id": x, "text": "..."}] without enforcing expected ids."""
-    text = (raw_output or "").strip()
-
-    if text.startswith("```"):
-        lines = text.splitlines()
-        cleaned = [line for line in lines if not line.strip().startswith("```")]
-        text = "\n".join(cleaned).strip()
+    text = _strip_code_fences(raw_output)
 
     try:
         data = json.loads(text)
@@ -60,16 +39,22 @@ def parse_id_text_array_partial(raw_output: str) -> dict[int, str]:
 
     out: dict[int, str] = {}
     for item in data:
-        if not isinstance(item, dict):
+        if type(item) is not dict:
             continue
         raw_id = item.get("id")
-        if raw_id is None:
-            continue
-        try:
-            seg_id = int(raw_id)
-        except (TypeError, ValueError):
+        if type(raw_id) is int:
+            seg_id = raw_id
+        elif raw_id is None:
             continue
+        else:
+            try:
+                seg_id = int(raw_id)
+            except (TypeError, ValueError):
+                continue
         if seg_id not in out:
-            out[seg_id] = str(item.get("text") or "").strip()
+            text_value = item.get("text")
+            if type(text_value) is not str:
+                text_value = str(text_value or "")
+            out[seg_id] = text_value.strip()
 
     return out
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import io
 import struct
 import sys
 from array import array
 from collections.abc import Iterable
+from typing import BinaryIO
 
 
 _MAGIC = b"SFVADP1\x00"
 _HEADER_STRUCT = struct.Struct("<8s d I")
+_VALUE_SIZE = array("f").itemsize
 
 
 def _as_float32_array(frame_probs: object) -> array:
@@ -21,6 +24,18 @@ def _as_float32_array(frame_probs: object) -> array:
             return out
         return arr
 
+    # numpy arrays: convert the whole buffer in one call instead of per element.
+    astype = getattr(frame_probs, "astype", None)
+    if callable(astype) and callable(getattr(frame_probs, "tobytes", None)):
+        try:
+            data = astype("f4", copy=False).tobytes()
+        except (TypeError, ValueError, AttributeError):
+            pass
+        else:
+            out = array("f")
+            out.frombytes(data)
+            return out
+
     tolist = getattr(frame_probs, "tolist", None)
     if callable(tolist):
         values = tolist()
@@ -60,6 +75,18 @@ def _as_float32_array(frame_probs: object) -> array:
     return out
 
 
+def write_vad_frame_probs(fp: BinaryIO, *, frame_probs: object, frame_hop_s: float) -> None:
+    """Write the ``encode_vad_frame_probs`` payload straight into ``fp``."""
+    hop = float(frame_hop_s)
+    arr = _as_float32_array(frame_probs)
+    count = int(len(arr))
+    if sys.byteorder != "little":
+        arr = array("f", arr)
+        arr.byteswap()
+    fp.write(_HEADER_STRUCT.pack(_MAGIC, hop, count))
+    fp.write(memoryview(arr))
+
+
 def encode_vad_frame_probs(*, frame_probs: object, frame_hop_s: float) -> bytes:
     """Encode frame probs to a compact binary payload.
 
@@ -69,29 +96,24 @@ def encode_vad_frame_probs(*, frame_probs: object, frame_hop_s: float) -> bytes:
       - count: uint32
       - values: float32[count]
     """
-    hop = float(frame_hop_s)
-    arr = _as_float32_array(frame_probs)
-    count = int(len(arr))
-    if sys.byteorder != "little":
-        arr = array("f", arr)
-        arr.byteswap()
-    header = _HEADER_STRUCT.pack(_MAGIC, hop, count)
-    return header + arr.tobytes()
+    buf = io.BytesIO()
+    write_vad_frame_probs(buf, frame_probs=frame_probs, frame_hop_s=frame_hop_s)
+    return buf.getvalue()
 
 
 def decode_vad_frame_probs(data: bytes) -> tuple[array, float]:
     """Decode payload into (float32 array('f'), frame_hop_s)."""
-    raw = bytes(data or b"")
+    raw = memoryview(data or b"")
     if len(raw) < _HEADER_STRUCT.size:
         return (array("f"), 0.0)
-    magic, hop, count = _HEADER_STRUCT.unpack(raw[: _HEADER_STRUCT.size])
+    magic, hop, count = _HEADER_STRUCT.unpack_from(raw)
     if magic != _MAGIC:
         return (array("f"), 0.0)
     values = raw[_HEADER_STRUCT.size :]
+    if count:
+        values = values[: count * _VALUE_SIZE]
     out = array("f")
     out.frombytes(values)
     if sys.byteorder != "little":
         out.byteswap()
-    if count and len(out) > count:
-        del out[count:]
     return (out, float(hop))
@@ -1,8 +1,60 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any, TypeVar
+
 import pytest
 
 from subflow.config import Settings
+from subflow.models.segment import ASRSegment
+from subflow.storage.artifact_store import ArtifactStore
+
+_T = TypeVar("_T")
+
+
+class InMemoryArtifactStore(ArtifactStore):
+    def __init__(self) -> None:
+        self.saved: list[tuple[str, str, str, bytes]] = []
+        self._blobs: dict[str, bytes] = {}
+        # Per-project and per-(project, stage) key indexes; dicts keep insertion order.
+        self._by_project: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._by_project_stage: defaultdict[tuple[str, str], dict[str, None]] = defaultdict(dict)
+
+    async def save(self, project_id: str, stage: str, name: str, data: bytes) -> str:
+        pid, st = str(project_id), str(stage)
+        key = f"{pid}/{st}/{name}"
+        payload = data if type(data) is bytes else bytes(data)
+        self.saved.append((pid, st, str(name), payload))
+        self._blobs[key] = payload
+        self._by_project[pid][key] = None
+        self._by_project_stage[(pid, st)][key] = None
+        return f"mem://{key}"
+
+    async def load(self, project_id: str, stage: str, name: str) -> bytes:
+        key = f"{project_id}/{stage}/{name}"
+        if key not in self._blobs:
+            raise FileNotFoundError(name)
+        return self._blobs[key]
+
+    async def list(self, project_id: str, stage: str | None = None) -> list[str]:
+        pid = str(project_id)
+        if stage is None:
+            keys = self._by_project.get(pid, {})
+        else:
+            keys = self._by_project_stage.get((pid, str(stage)), {})
+        return [f"mem://{key}" for key in keys]
+
+    async def delete_project(self, project_id: str) -> int:
+        pid = str(project_id)
+        keys = self._by_project.pop(pid, {})
+        for key in keys:
+            del self._blobs[key]
+            self._by_project_stage.pop((pid, key.split("/", 2)[1]), None)
+        return len(keys)
+
+    async def list_project_ids(self) -> list[str]:
+        return sorted(self._by_project)
 
 
 @pytest.fixture()
@@ -13,3 +65,35 @@ def settings(tmp_path) -> Settings:
         models_dir=str(tmp_path / "models"),
         log_dir=str(tmp_path / "logs"),
     )
+
+
+@pytest.fixture()
+def memory_store() -> InMemoryArtifactStore:
+    return InMemoryArtifactStore()
+
+
+@pytest.fixture()
+def asr_segments_10() -> list[ASRSegment]:
+    """Ten 1s segments ``t0..t9``, built fresh per test since stages mutate them."""
+    return [ASRSegment(id=i, start=float(i), end=float(i + 1), text=f"t{i}") for i in range(10)]
+
+
+@pytest.fixture()
+def asr_segments_s10() -> list[ASRSegment]:
+    """Ten 1s segments ``S0..S9`` where only the last one ends a sentence."""
+    return [
+        ASRSegment(id=i, start=float(i), end=float(i + 1), text=f"S{i}." if i == 9 else f"S{i}")
+        for i in range(10)
+    ]
+
+
+@pytest.fixture(scope="session")
+def make_stage() -> Callable[..., Any]:
+    """Build a stage without running ``__init__`` (no provider/settings wiring)."""
+
+    def _make(cls: type[_T], **attrs: Any) -> _T:
+        stage = cls.__new__(cls)
+        stage.__dict__.update(attrs)
+        return stage
+
+    return _make
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
+from math import inf, isnan, nan
 from pathlib import Path
 
 import pytest
 
 from subflow.repositories import ProjectRepository
 from subflow.storage.artifact_store import LocalArtifactStore
+from subflow.utils.vad_frame_probs_io import decode_vad_frame_probs, write_vad_frame_probs
 
 
 @pytest.mark.asyncio
@@ -89,3 +91,68 @@ async def test_project_repo_list_all_ids_returns_ids() -> None:
     repo = ProjectRepository(_FakePool([("proj_1",), ("proj_2",)]))
     assert await repo.list_all_ids() == ["proj_1", "proj_2"]
 
+
+
+@pytest.mark.asyncio
+async def test_local_artifact_store_json_roundtrip_is_compact_utf8(tmp_path: Path) -> None:
+    store = LocalArtifactStore(str(tmp_path / "data"))
+    payload = {"text": "你好", "segments": [{"id": 1, "start": 0.5}], "by_id": {2: "b"}}
+
+    ident = await store.save_json("proj_j", "asr", "out.json", payload)
+
+    raw = Path(ident).read_bytes()
+    assert b" " not in raw
+    assert "你好".encode("utf-8") in raw
+    assert await store.load_json("proj_j", "asr", "out.json") == {
+        "text": "你好",
+        "segments": [{"id": 1, "start": 0.5}],
+        "by_id": {"2": "b"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_local_artifact_store_json_roundtrip_keeps_non_finite_floats(tmp_path: Path) -> None:
+    store = LocalArtifactStore(str(tmp_path / "data"))
+
+    await store.save_json("proj_j", "vad", "stats.json", {"mean": nan, "max": inf})
+
+    loaded = await store.load_json("proj_j", "vad", "stats.json")
+    assert isnan(loaded["mean"])
+    assert loaded["max"] == inf
+
+
+@pytest.mark.asyncio
+async def test_local_artifact_store_save_from_streams_into_file(tmp_path: Path) -> None:
+    store = LocalArtifactStore(str(tmp_path / "data"))
+
+    ident = await store.save_from(
+        "proj_s",
+        "vad",
+        "vad_frame_probs.bin",
+        lambda fp: write_vad_frame_probs(fp, frame_probs=[0.25, 0.75], frame_hop_s=0.02),
+    )
+
+    assert ident.endswith("vad_frame_probs.bin")
+    probs, hop = decode_vad_frame_probs(await store.load("proj_s", "vad", "vad_frame_probs.bin"))
+    assert list(probs) == [0.25, 0.75]
+    assert hop == 0.02
+
+
+@pytest.mark.asyncio
+async def test_local_artifact_store_iter_project_ids_matches_list(tmp_path: Path) -> None:
+    base_dir = tmp_path / "data"
+    store = LocalArtifactStore(str(base_dir))
+    assert [pid async for pid in store.iter_project_ids()] == []
+
+    for pid in ("proj_b", "proj_a"):
+        (base_dir / "projects" / pid / "stage1").mkdir(parents=True)
+    (base_dir / "projects" / "stray.txt").write_text("x", encoding="utf-8")
+
+    assert sorted([pid async for pid in store.iter_project_ids()]) == await store.list_project_ids()
+
+
+@pytest.mark.asyncio
+async def test_project_repo_list_missing_ids_returns_orphans_and_skips_empty_input() -> None:
+    repo = ProjectRepository(_FakePool([("orphan",)]))
+    assert await repo.list_missing_ids([]) == []
+    assert await repo.list_missing_ids(iter(["orphan", "kept"])) == ["orphan"]
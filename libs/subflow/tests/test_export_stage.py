@@ -18,7 +18,7 @@ async def test_export_stage_generates_subtitle_text(settings) -> None:
                 id=0,
                 text="a",
                 translation="甲",
-                asr_segment_ids=[0],
+                asr_segment_ids=(0,),
                 translation_chunks=[TranslationChunk(text="甲", segment_id=0)],
             )
         ],
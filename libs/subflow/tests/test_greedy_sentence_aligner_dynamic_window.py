@@ -240,3 +240,33 @@ async def test_greedy_sentence_align_region_does_not_retry_when_at_region_end()
     assert len(segs) == 1
     assert segs[0].start == 0.0
     assert segs[0].end == 9.0
+
+
+@pytest.mark.asyncio
+async def test_greedy_sentence_align_region_converts_frame_probs_once() -> None:
+    class _Probs:
+        """Tensor-like stand-in that counts full conversions."""
+
+        def __init__(self, values: list[float]) -> None:
+            self.values = values
+            self.tolist_calls = 0
+
+        def tolist(self) -> list[float]:
+            self.tolist_calls += 1
+            return list(self.values)
+
+    async def _transcribe_window(start: float, end: float) -> str:  # noqa: ARG001
+        return "One. Two."
+
+    probs = _Probs([1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0, 1.0])
+    segs = await greedy_sentence_align_region(
+        _transcribe_window,
+        frame_probs=probs,
+        frame_hop_s=1.0,
+        region_start=0.0,
+        region_end=10.0,
+        config=GreedySentenceAlignerConfig(max_chunk_s=10.0, min_segment_s=0.5),
+    )
+
+    assert len(segs) > 1
+    assert probs.tolist_calls == 1
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import time
+
 import pytest
 
 from subflow.config import Settings
 from subflow.exceptions import ConfigurationError
-from subflow.models.segment import ASRSegment
+from subflow.pipeline import concurrency
+from subflow.pipeline.concurrency import ConcurrencyTracker, RateLimiter
 from subflow.stages.base_llm import BaseLLMStage
 from subflow.stages.llm_passes import SemanticChunkingPass
 
@@ -20,7 +23,9 @@ class _DummyLLMStage(BaseLLMStage):
         return context
 
 
-def test_base_llm_stage_get_concurrency_limit_selects_by_profile(monkeypatch, tmp_path) -> None:
+def test_base_llm_stage_get_concurrency_limit_selects_by_profile(
+    monkeypatch, tmp_path, make_stage
+) -> None:
     monkeypatch.chdir(tmp_path)
     settings = Settings(
         _env_file=None,
@@ -31,15 +36,60 @@ def test_base_llm_stage_get_concurrency_limit_selects_by_profile(monkeypatch, tm
         concurrency={"llm_fast": 11, "llm_power": 3, "asr": 1},
     )
 
-    stage = _DummyLLMStage.__new__(_DummyLLMStage)
-    stage.profile = "power"
+    stage = make_stage(_DummyLLMStage, profile="power")
     assert stage.get_concurrency_limit(settings) == 3
     stage.profile = "fast"
     assert stage.get_concurrency_limit(settings) == 11
 
 
 @pytest.mark.asyncio
-async def test_semantic_chunking_pass_raises_without_api_key(monkeypatch, tmp_path) -> None:
+async def test_rate_limiter_paces_requests_beyond_bucket() -> None:
+    limiter = RateLimiter(2, period=0.2)
+    started = time.monotonic()
+    await limiter.acquire()
+    await limiter.acquire()
+    assert time.monotonic() - started < 0.05
+
+    # The bucket is empty; the third request waits for one token (period / rate).
+    await limiter.acquire()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_concurrency_tracker_update_rates_toggles_limiter() -> None:
+    tracker = ConcurrencyTracker(maxima={"llm_fast": 4}, rates={"llm_fast": 30})
+    assert tracker.get_rate("llm_fast") == 30
+    tracker.update_rates({"llm_fast": 0})
+    assert tracker.get_rate("llm_fast") == 0
+
+
+def test_concurrency_tracker_selects_rpm_by_profile(monkeypatch, tmp_path) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(concurrency, "_TRACKER", None)
+    settings = Settings(
+        _env_file=None,
+        artifact_store_backend="local",
+        data_dir=str(tmp_path / "data"),
+        models_dir=str(tmp_path / "models"),
+        log_dir=str(tmp_path / "logs"),
+        concurrency={
+            "llm_fast": 11,
+            "llm_power": 3,
+            "asr": 1,
+            "llm_fast_rpm": 600,
+            "llm_power_rpm": 60,
+        },
+    )
+
+    tracker = concurrency.get_concurrency_tracker(settings)
+    assert tracker.get_rate("llm_power") == 60
+    assert tracker.get_rate("llm_fast") == 600
+    assert tracker.get_rate("asr") == 0
+
+
+@pytest.mark.asyncio
+async def test_semantic_chunking_pass_raises_without_api_key(
+    monkeypatch, tmp_path, asr_segments_10, make_stage
+) -> None:
     monkeypatch.chdir(tmp_path)
     settings = Settings(
         _env_file=None,
@@ -50,18 +100,12 @@ async def test_semantic_chunking_pass_raises_without_api_key(monkeypatch, tmp_pa
         concurrency={"llm_fast": 10, "llm_power": 10, "asr": 1},
     )
 
-    stage = SemanticChunkingPass.__new__(SemanticChunkingPass)
-    stage.settings = settings
-    stage.profile = "power"
-    stage.api_key = ""
+    stage = make_stage(SemanticChunkingPass, settings=settings, profile="power", api_key="")
 
     with pytest.raises(ConfigurationError):
         await stage.execute(
             {
-                "asr_segments": [
-                    ASRSegment(id=i, start=float(i), end=float(i + 1), text=f"t{i}")
-                    for i in range(6)
-                ],
+                "asr_segments": asr_segments_10[:6],
                 "target_language": "zh",
                 "global_context": {"topic": "x"},
             }
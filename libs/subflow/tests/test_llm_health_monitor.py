@@ -116,3 +116,27 @@ async def test_llm_health_monitor_overall_status() -> None:
         power_model="claude-sonnet-4-20250514",
     )
     assert snap2.status == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_llm_health_monitor_counts_only_last_hour() -> None:
+    monitor = LLMHealthMonitor(redis=None, stale_after_s=3600)
+    now = time.time()
+
+    for offset in (7200.0, 3700.0, 120.0, 1.0, 0.5):
+        await monitor.report_error(
+            profile="fast",
+            provider="openai",
+            model="gpt-4o-mini",
+            latency_ms=1,
+            error="boom",
+            at_ts=now - offset,
+        )
+
+    fast = await monitor.provider_health(
+        profile="fast",
+        configured_provider="openai",
+        configured_model="gpt-4o-mini",
+    )
+    assert fast.error_count_1h == 3
+    assert fast.success_count_1h == 0
@@ -10,21 +10,19 @@ from subflow.utils.llm_json_parser import parse_id_text_array
 
 
 @pytest.mark.asyncio
-async def test_llm_asr_correction_raises_without_api_key(settings) -> None:
-    stage = LLMASRCorrectionStage.__new__(LLMASRCorrectionStage)
-    stage.settings = settings
-    stage.profile = "fast"
-    stage.api_key = ""
+async def test_llm_asr_correction_raises_without_api_key(settings, make_stage) -> None:
+    stage = make_stage(LLMASRCorrectionStage, settings=settings, profile="fast", api_key="")
 
     ctx = {"asr_segments": [ASRSegment(id=0, start=0.0, end=1.0, text="hi", language="en")]}
     with pytest.raises(ConfigurationError):
         await stage.execute(ctx)
 
 
-def test_compact_global_context_defaults() -> None:
-    ctx = _compact_global_context({"topic": "", "glossary": {"a": "b"}})
+@pytest.mark.parametrize("glossary", [{"a": "b"}, {}])
+def test_compact_global_context_defaults(glossary: dict[str, str]) -> None:
+    ctx = _compact_global_context({"topic": "", "glossary": glossary})
     assert ctx["topic"] == "unknown"
-    assert ctx["glossary"] == {"a": "b"}
+    assert ctx["glossary"] == glossary
 
 
 def test_parse_id_text_array_parses_expected_ids() -> None:
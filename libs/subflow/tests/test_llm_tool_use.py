@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
+from collections.abc import AsyncIterator
+
 import httpx
 import pytest
+import pytest_asyncio
 
 from subflow.exceptions import StageExecutionError
 from subflow.models.segment import ASRSegment
@@ -40,32 +44,86 @@ def test_parse_tool_arguments_safe_repairs_truncated_json() -> None:
     assert parse_tool_arguments_safe(raw) == {"id": 1, "translation": "未完成的字符串"}
 
 
-@pytest.mark.asyncio
-async def test_openai_compat_complete_with_tools_parses_streamed_tool_calls() -> None:
-    sse = "\n".join(
-        [
-            'data: {"choices":[{"delta":{"tool_calls":[{"index":0,"id":"call_0","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":0,"}},{"index":1,"id":"call_1","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":1,\\"translation\\":\\"t1\\"}"}}]}}]}',
-            "",
-            'data: {"choices":[{"delta":{"tool_calls":[{"index":0,"function":{"arguments":"\\"translation\\":\\"t0\\"}"}}]}}]}',
-            "",
-            "data: [DONE]",
-            "",
-        ]
-    ).encode("utf-8")
-
-    def _handler(request: httpx.Request) -> httpx.Response:  # noqa: ANN001
-        assert request.url.path.endswith("/chat/completions")
-        return httpx.Response(200, content=sse, headers={"content-type": "text/event-stream"})
+_STREAMED_TOOL_CALLS_SSE: bytes = (
+    b'data: {"choices":[{"delta":{"tool_calls":[{"index":0,"id":"call_0","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":0,"}},{"index":1,"id":"call_1","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":1,\\"translation\\":\\"t1\\"}"}}]}}]}\n\n'
+    b'data: {"choices":[{"delta":{"tool_calls":[{"index":0,"function":{"arguments":"\\"translation\\":\\"t0\\"}"}}]}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
 
-    provider = OpenAICompatProvider(api_key="x", model="gpt-4", base_url="https://example.com/v1")
-    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+_UNPARSEABLE_TOOL_ARGS_SSE: bytes = (
+    b'data: {"choices":[{"delta":{"tool_calls":[{"index":0,"id":"call_0","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":0,\\"translation\\":"}},{"index":1,"id":"call_1","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":1,\\"translation\\":\\"t1\\"}"}}]}}]}\n\n'
+    b"data: [DONE]\n\n"
+)
+
+
+def _content_event(text: str) -> bytes:
+    return b'data: {"choices":[{"delta":{"content":"' + text.encode() + b'"}}]}'
+
+
+# Tuples are streamed chunk by chunk to exercise event boundaries split across reads.
+_SPLIT_EVENT_CHUNKS: tuple[bytes, ...] = (
+    _content_event("a")[:20],
+    _content_event("a")[20:] + b"\r",
+    b"\n\r\n: ping\n\ndata: [DO",
+    b"NE]",
+)
+
+_SPLIT_CRLF_CHUNKS: tuple[bytes, ...] = (
+    _content_event("a") + b"\r\n\r",
+    b"\n",
+    _content_event("b") + b"\r\r",
+    _content_event("c") + b"\r",
+)
+
+# The user message content acts as a canary that selects the SSE body to replay.
+_SSE_BY_CANARY: dict[bytes, bytes | tuple[bytes, ...]] = {
+    b"streamed-tool-calls": _STREAMED_TOOL_CALLS_SSE,
+    b"unparseable-tool-args": _UNPARSEABLE_TOOL_ARGS_SSE,
+    b"split-event-chunks": _SPLIT_EVENT_CHUNKS,
+    b"split-crlf-chunks": _SPLIT_CRLF_CHUNKS,
+}
+
+
+async def _stream_chunks(chunks: tuple[bytes, ...]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def _dispatch(request: httpx.Request) -> httpx.Response:
+    assert request.url.path.endswith("/chat/completions")
+    for canary, sse in _SSE_BY_CANARY.items():
+        if canary in request.content:
+            content = sse if isinstance(sse, bytes) else _stream_chunks(sse)
+            return httpx.Response(
+                200, content=content, headers={"content-type": "text/event-stream"}
+            )
+    return httpx.Response(400, content=b"unknown canary")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_mock_client() -> AsyncIterator[httpx.AsyncClient]:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(_dispatch))
     try:
-        result = await provider.complete_with_tools(
-            messages=[Message(role="user", content="hi")],
-            tools=[TRANSLATE_SEGMENT_TOOL],
-        )
+        yield client
     finally:
-        await provider.close()
+        await client.aclose()
+
+
+def _mock_provider(client: httpx.AsyncClient) -> OpenAICompatProvider:
+    provider = OpenAICompatProvider(api_key="x", model="gpt-4", base_url="https://example.com/v1")
+    provider._client = client
+    return provider
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_compat_complete_with_tools_parses_streamed_tool_calls(
+    shared_mock_client: httpx.AsyncClient,
+) -> None:
+    provider = _mock_provider(shared_mock_client)
+    result = await provider.complete_with_tools(
+        messages=[Message(role="user", content="streamed-tool-calls")],
+        tools=[TRANSLATE_SEGMENT_TOOL],
+    )
 
     assert [c.id for c in result.tool_calls] == ["call_0", "call_1"]
     assert [c.arguments for c in result.tool_calls] == [
@@ -74,37 +132,42 @@ async def test_openai_compat_complete_with_tools_parses_streamed_tool_calls() ->
     ]
 
 
-@pytest.mark.asyncio
-async def test_openai_compat_complete_with_tools_skips_unparseable_tool_arguments() -> None:
-    sse = "\n".join(
-        [
-            'data: {"choices":[{"delta":{"tool_calls":[{"index":0,"id":"call_0","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":0,\\"translation\\":"}},{"index":1,"id":"call_1","type":"function","function":{"name":"translate_segment","arguments":"{\\"id\\":1,\\"translation\\":\\"t1\\"}"}}]}}]}',
-            "",
-            "data: [DONE]",
-            "",
-        ]
-    ).encode("utf-8")
-
-    def _handler(request: httpx.Request) -> httpx.Response:  # noqa: ANN001
-        assert request.url.path.endswith("/chat/completions")
-        return httpx.Response(200, content=sse, headers={"content-type": "text/event-stream"})
-
-    provider = OpenAICompatProvider(api_key="x", model="gpt-4", base_url="https://example.com/v1")
-    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
-    try:
-        result = await provider.complete_with_tools(
-            messages=[Message(role="user", content="hi")],
-            tools=[TRANSLATE_SEGMENT_TOOL],
-        )
-    finally:
-        await provider.close()
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_compat_complete_with_tools_skips_unparseable_tool_arguments(
+    shared_mock_client: httpx.AsyncClient,
+) -> None:
+    provider = _mock_provider(shared_mock_client)
+    result = await provider.complete_with_tools(
+        messages=[Message(role="user", content="unparseable-tool-args")],
+        tools=[TRANSLATE_SEGMENT_TOOL],
+    )
 
     assert [c.id for c in result.tool_calls] == ["call_1"]
     assert [c.arguments for c in result.tool_calls] == [{"id": 1, "translation": "t1"}]
 
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_compat_complete_handles_events_split_across_chunks(
+    shared_mock_client: httpx.AsyncClient,
+) -> None:
+    provider = _mock_provider(shared_mock_client)
+    text = await provider.complete([Message(role="user", content="split-event-chunks")])
+
+    assert text == "a"
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_openai_compat_complete_handles_crlf_boundary_split_across_chunks(
+    shared_mock_client: httpx.AsyncClient,
+) -> None:
+    provider = _mock_provider(shared_mock_client)
+    text = await provider.complete([Message(role="user", content="split-crlf-chunks")])
+
+    assert text == "abc"
+
+
 @pytest.mark.asyncio
-async def test_semantic_chunking_prefers_tool_use(settings) -> None:
+async def test_semantic_chunking_prefers_tool_use(settings, make_stage) -> None:
     class _DummyToolLLM:
         def __init__(self) -> None:
             self.calls = 0
@@ -135,11 +198,13 @@ async def test_semantic_chunking_prefers_tool_use(settings) -> None:
                 usage=LLMUsage(prompt_tokens=1, completion_tokens=1),
             )
 
-    stage = SemanticChunkingPass.__new__(SemanticChunkingPass)
-    stage.settings = settings
-    stage.profile = "power"
-    stage.api_key = "x"
-    stage.llm = _DummyToolLLM()
+    stage = make_stage(
+        SemanticChunkingPass,
+        settings=settings,
+        profile="power",
+        api_key="x",
+        llm=_DummyToolLLM(),
+    )
 
     out = await stage.execute(
         {
@@ -158,7 +223,9 @@ async def test_semantic_chunking_prefers_tool_use(settings) -> None:
 
 
 @pytest.mark.asyncio
-async def test_semantic_chunking_tool_use_raises_when_tools_unsupported(settings) -> None:
+async def test_semantic_chunking_tool_use_raises_when_tools_unsupported(
+    settings, make_stage
+) -> None:
     class _DummyUnsupportedLLM:
         def __init__(self) -> None:
             self.calls = 0
@@ -167,11 +234,13 @@ async def test_semantic_chunking_tool_use_raises_when_tools_unsupported(settings
             self.calls += 1
             raise NotImplementedError("no tools")
 
-    stage = SemanticChunkingPass.__new__(SemanticChunkingPass)
-    stage.settings = settings
-    stage.profile = "power"
-    stage.api_key = "x"
-    stage.llm = _DummyUnsupportedLLM()
+    stage = make_stage(
+        SemanticChunkingPass,
+        settings=settings,
+        profile="power",
+        api_key="x",
+        llm=_DummyUnsupportedLLM(),
+    )
 
     with pytest.raises(StageExecutionError):
         await stage.execute(
@@ -188,7 +257,48 @@ async def test_semantic_chunking_tool_use_raises_when_tools_unsupported(settings
 
 
 @pytest.mark.asyncio
-async def test_semantic_chunking_reduces_batch_size_on_large_missing(settings) -> None:
+async def test_semantic_chunking_cancels_sibling_batches_on_failure(settings, make_stage) -> None:
+    class _DummyLLM:
+        def __init__(self) -> None:
+            self.cancelled = False
+
+        async def complete_with_tools(self, messages, tools, **kwargs):  # noqa: ANN001, ARG002
+            user = str(messages[-1].content or "")
+            if '"id": 0' in user:
+                raise NotImplementedError("no tools")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+
+    settings.llm_limits.translation_batch_size = 1
+    stage = make_stage(
+        SemanticChunkingPass,
+        settings=settings,
+        profile="power",
+        api_key="x",
+        llm=_DummyLLM(),
+    )
+
+    with pytest.raises(StageExecutionError):
+        await stage.execute(
+            {
+                "asr_segments": [
+                    ASRSegment(id=0, start=0.0, end=1.0, text="A."),
+                    ASRSegment(id=1, start=1.0, end=2.0, text="B."),
+                ],
+                "target_language": "zh",
+                "global_context": {"topic": "x"},
+            }
+        )
+    assert stage.llm.cancelled is True
+
+
+@pytest.mark.asyncio
+async def test_semantic_chunking_reduces_batch_size_on_large_missing(
+    settings, asr_segments_s10, make_stage
+) -> None:
     class _DummyLLM:
         def __init__(self) -> None:
             self.calls = 0
@@ -205,7 +315,7 @@ async def test_semantic_chunking_reduces_batch_size_on_large_missing(settings) -
         ):
             self.calls += 1
             user = str(messages[-1].content or "")
-            payload = json.loads(user.split("待翻译：\n", 1)[1])
+            payload = json.loads(user.partition("待翻译：\n")[2])
             self.request_sizes.append(len(payload))
 
             if self.calls == 1:
@@ -224,23 +334,17 @@ async def test_semantic_chunking_reduces_batch_size_on_large_missing(settings) -
                 usage=LLMUsage(prompt_tokens=1, completion_tokens=1),
             )
 
-    stage = SemanticChunkingPass.__new__(SemanticChunkingPass)
-    stage.settings = settings
-    stage.profile = "power"
-    stage.api_key = "x"
-    stage.llm = _DummyLLM()
+    stage = make_stage(
+        SemanticChunkingPass,
+        settings=settings,
+        profile="power",
+        api_key="x",
+        llm=_DummyLLM(),
+    )
 
     out = await stage.execute(
         {
-            "asr_segments": [
-                ASRSegment(
-                    id=i,
-                    start=float(i),
-                    end=float(i + 1),
-                    text=f"S{i}." if i == 9 else f"S{i}",
-                )
-                for i in range(10)
-            ],
+            "asr_segments": asr_segments_s10,
             "target_language": "zh",
             "global_context": {"topic": "x"},
         }
@@ -252,7 +356,9 @@ async def test_semantic_chunking_reduces_batch_size_on_large_missing(settings) -
 
 
 @pytest.mark.asyncio
-async def test_semantic_chunking_skips_missing_single_translation_after_retry(settings) -> None:
+async def test_semantic_chunking_skips_missing_single_translation_after_retry(
+    settings, make_stage
+) -> None:
     class _MetricsRecorder:
         def __init__(self) -> None:
             self.metrics_calls: list[dict] = []
@@ -292,11 +398,13 @@ async def test_semantic_chunking_skips_missing_single_translation_after_retry(se
                 usage=LLMUsage(prompt_tokens=1, completion_tokens=1),
             )
 
-    stage = SemanticChunkingPass.__new__(SemanticChunkingPass)
-    stage.settings = settings
-    stage.profile = "power"
-    stage.api_key = "x"
-    stage.llm = _DummyLLM()
+    stage = make_stage(
+        SemanticChunkingPass,
+        settings=settings,
+        profile="power",
+        api_key="x",
+        llm=_DummyLLM(),
+    )
 
     recorder = _MetricsRecorder()
     out = await stage.execute(
@@ -320,7 +428,9 @@ async def test_semantic_chunking_skips_missing_single_translation_after_retry(se
 
 
 @pytest.mark.asyncio
-async def test_semantic_chunking_reports_recovered_when_retry_succeeds(settings) -> None:
+async def test_semantic_chunking_reports_recovered_when_retry_succeeds(
+    settings, make_stage
+) -> None:
     class _MetricsRecorder:
         def __init__(self) -> None:
             self.metrics_calls: list[dict] = []
@@ -366,11 +476,13 @@ async def test_semantic_chunking_reports_recovered_when_retry_succeeds(settings)
                 usage=LLMUsage(prompt_tokens=1, completion_tokens=1),
             )
 
-    stage = SemanticChunkingPass.__new__(SemanticChunkingPass)
-    stage.settings = settings
-    stage.profile = "power"
-    stage.api_key = "x"
-    stage.llm = _DummyLLM()
+    stage = make_stage(
+        SemanticChunkingPass,
+        settings=settings,
+        profile="power",
+        api_key="x",
+        llm=_DummyLLM(),
+    )
 
     recorder = _MetricsRecorder()
     out = await stage.execute(
@@ -70,3 +70,16 @@ def test_project_roundtrip_includes_exports() -> None:
     assert len(restored.exports) == 1
     assert restored.exports[0].id == "export_1"
     assert restored.exports[0].format == SubtitleFormat.SRT
+
+
+def test_project_set_stage_run_replaces_by_stage() -> None:
+    project = Project(id="p1", name="n", media_url="u")
+    project.set_stage_run(StageRun(stage=StageName.VAD, status=StageRunStatus.COMPLETED))
+    project.set_stage_run(StageRun(stage=StageName.ASR, status=StageRunStatus.FAILED))
+    project.set_stage_run(StageRun(stage=StageName.ASR, status=StageRunStatus.RUNNING))
+
+    assert [sr.stage for sr in project.stage_runs] == [StageName.VAD, StageName.ASR]
+    retried = project.get_stage_run(StageName.ASR)
+    assert retried is not None
+    assert retried.status == StageRunStatus.RUNNING
+    assert project.get_stage_run(StageName.LLM) is None
@@ -8,44 +8,6 @@ from subflow.error_codes import ErrorCode
 from subflow.exceptions import StageExecutionError
 from subflow.models.project import Project, ProjectStatus, StageName
 from subflow.pipeline.orchestrator import PipelineOrchestrator, _StageRunProgressReporter
-from subflow.storage.artifact_store import ArtifactStore
-
-
-class InMemoryArtifactStore(ArtifactStore):
-    def __init__(self) -> None:
-        self._data: dict[tuple[str, str, str], bytes] = {}
-
-    async def save(self, project_id: str, stage: str, name: str, data: bytes) -> str:
-        key = (str(project_id), str(stage), str(name))
-        self._data[key] = bytes(data)
-        return f"mem://{project_id}/{stage}/{name}"
-
-    async def load(self, project_id: str, stage: str, name: str) -> bytes:
-        key = (str(project_id), str(stage), str(name))
-        if key not in self._data:
-            raise FileNotFoundError(name)
-        return self._data[key]
-
-    async def list(self, project_id: str, stage: str | None = None) -> list[str]:
-        out: list[str] = []
-        for pid, st, name in self._data.keys():
-            if pid != project_id:
-                continue
-            if stage is not None and st != stage:
-                continue
-            out.append(f"mem://{pid}/{st}/{name}")
-        return out
-
-    async def delete_project(self, project_id: str) -> int:
-        removed = 0
-        for key in list(self._data.keys()):
-            if key[0] == str(project_id):
-                removed += 1
-                self._data.pop(key, None)
-        return removed
-
-    async def list_project_ids(self) -> list[str]:
-        return sorted({pid for (pid, _st, _name) in self._data.keys()})
 
 
 class _InMemoryProjectRepo:
@@ -168,7 +130,7 @@ class _NoopRepo:
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _Runner:
     stage: StageName
     fail: bool = False
@@ -194,7 +156,7 @@ class _Runner:
         for pct in list(self.progress_steps or []):
             if progress_reporter is not None:
                 await progress_reporter.report(int(pct), f"step {pct}")
-        return dict(ctx), {"ok.txt": "mem://ok"}
+        return ctx, {"ok.txt": "mem://ok"}
 
 
 @pytest.mark.asyncio
@@ -239,10 +201,15 @@ async def test_progress_reporter_rate_limits_by_percent_step() -> None:
     assert sr.progress == 100
     assert len(updates) == 3
 
+    await reporter.report(50, "finalizing")
+    assert sr.progress == 100
+    assert sr.progress_message == "finalizing"
+    assert len(updates) == 4
+
 
 @pytest.mark.asyncio
-async def test_orchestrator_runs_and_marks_completed(settings, monkeypatch) -> None:
-    store = InMemoryArtifactStore()
+async def test_orchestrator_runs_and_marks_completed(settings, monkeypatch, memory_store) -> None:
+    store = memory_store
     updates: list[Project] = []
 
     async def on_update(p: Project) -> None:
@@ -290,8 +257,10 @@ async def test_orchestrator_runs_and_marks_completed(settings, monkeypatch) -> N
 
 
 @pytest.mark.asyncio
-async def test_orchestrator_error_sets_failed_status_and_error_code(settings, monkeypatch) -> None:
-    store = InMemoryArtifactStore()
+async def test_orchestrator_error_sets_failed_status_and_error_code(
+    settings, monkeypatch, memory_store
+) -> None:
+    store = memory_store
     project = Project(id="proj_2", name="demo", media_url="u", target_language="zh")
     project_repo = _InMemoryProjectRepo(project)
     stage_run_repo = _InMemoryStageRunRepo()
@@ -323,9 +292,9 @@ async def test_orchestrator_error_sets_failed_status_and_error_code(settings, mo
 
 @pytest.mark.asyncio
 async def test_orchestrator_retry_resets_failed_stage_and_clears_downstream_data(
-    settings, monkeypatch
+    settings, monkeypatch, memory_store
 ) -> None:
-    store = InMemoryArtifactStore()
+    store = memory_store
     project = Project(id="proj_retry", name="demo", media_url="u", target_language="zh")
     project.current_stage = 3
     project_repo = _InMemoryProjectRepo(project)
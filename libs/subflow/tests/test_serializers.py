@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+from itertools import repeat
+
 from subflow.models.segment import (
     ASRCorrectedSegment,
     ASRSegment,
@@ -37,6 +40,20 @@ def test_asr_segments_roundtrip() -> None:
     assert restored[0].language == "en"
 
 
+def _asr_fixture(n: int) -> list[ASRSegment]:
+    starts = [float(i) for i in range(n)]
+    return list(
+        map(ASRSegment, range(n), starts, [s + 1.0 for s in starts], repeat("hi"), repeat("en"))
+    )
+
+
+def test_asr_segments_roundtrip_large() -> None:
+    items = _asr_fixture(2000)
+    restored = deserialize_asr_segments(json.loads(json.dumps(serialize_asr_segments(items))))
+    assert restored == items
+    assert restored[0].language is restored[-1].language
+
+
 def test_asr_corrected_segments_roundtrip_sorted() -> None:
     corrected = {
         2: ASRCorrectedSegment(id=2, asr_segment_id=2, text="c"),
@@ -55,7 +72,7 @@ def test_semantic_chunks_roundtrip_with_translation_chunks() -> None:
             id=0,
             text="a b",
             translation="甲乙",
-            asr_segment_ids=[0, 1],
+            asr_segment_ids=(0, 1),
             translation_chunks=[
                 TranslationChunk(text="甲", segment_id=0),
                 TranslationChunk(text="乙", segment_id=1),
@@ -64,7 +81,7 @@ def test_semantic_chunks_roundtrip_with_translation_chunks() -> None:
     ]
     raw = serialize_semantic_chunks(chunks)
     restored = deserialize_semantic_chunks(raw)
-    assert restored[0].asr_segment_ids == [0, 1]
+    assert restored[0].asr_segment_ids == (0, 1)
     assert restored[0].translation_chunks and restored[0].translation_chunks[0].text == "甲"
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import shutil
+from dataclasses import dataclass, field
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -12,7 +13,7 @@ from subflow.stages.vad import VADStage
 
 @dataclass
 class _ProgressRecorder:
-    calls: list[tuple[int, str]]
+    calls: list[tuple[int, str]] = field(default_factory=list)
 
     async def report(self, progress: int, message: str) -> None:
         self.calls.append((int(progress), str(message)))
@@ -32,7 +33,8 @@ async def test_audio_preprocess_reports_progress(settings, monkeypatch, tmp_path
             return vocals_path
 
         async def normalize_audio(self, in_path: str, out_path: str, *, target_db: float) -> Path:  # noqa: ARG002
-            Path(out_path).write_bytes(Path(in_path).read_bytes())
+            if Path(in_path) != Path(out_path):
+                shutil.copyfile(in_path, out_path)
             return Path(out_path)
 
     class _FakeBlobStore:
@@ -87,7 +89,7 @@ async def test_audio_preprocess_reports_progress(settings, monkeypatch, tmp_path
     monkeypatch.setattr("subflow.stages.audio_preprocess.BlobStore", _FakeBlobStore)
 
     stage = AudioPreprocessStage(settings)
-    recorder = _ProgressRecorder(calls=[])
+    recorder = _ProgressRecorder()
 
     video = tmp_path / "in.mp4"
     video.write_bytes(b"mp4")
@@ -112,11 +114,11 @@ async def test_vad_reports_progress(settings, monkeypatch, tmp_path) -> None:
 
     monkeypatch.setattr("subflow.stages.vad.get_vad_provider", lambda _cfg: _FakeVADProvider())
     stage = VADStage(settings)
-    recorder = _ProgressRecorder(calls=[])
+    recorder = _ProgressRecorder()
 
     audio = tmp_path / "vocals.wav"
     audio.write_bytes(b"wav")
 
     out = await stage.execute({"vocals_audio_path": str(audio)}, progress_reporter=recorder)
-    assert recorder.calls == [(0, "VAD 检测中..."), (100, "VAD 检测完成")]
+    assert list(recorder.calls) == [(0, "VAD 检测中..."), (100, "VAD 检测完成")]
     assert out["vad_regions"]
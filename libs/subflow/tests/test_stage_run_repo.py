@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from typing import Any, Self
+
+import pytest
+from psycopg.types.json import Jsonb
+
+from subflow.repositories.stage_run_repo import StageRunRepository
+
+
+class _RecordingCursor:
+    def __init__(self, executed: list[tuple[str, dict[str, Any]]]) -> None:
+        self._executed = executed
+
+    async def execute(self, sql: str, params: dict[str, Any]) -> None:
+        self._executed.append((sql, params))
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class _RecordingConn:
+    def __init__(self) -> None:
+        self.executed: list[tuple[str, dict[str, Any]]] = []
+        self.commits = 0
+
+    def cursor(self, *args, **kwargs) -> _RecordingCursor:
+        return _RecordingCursor(self.executed)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+
+class _RecordingPool:
+    def __init__(self) -> None:
+        self.conn = _RecordingConn()
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+@pytest.mark.asyncio
+async def test_set_progress_merges_metadata_in_one_update() -> None:
+    pool = _RecordingPool()
+    repo = StageRunRepository(pool)
+
+    await repo.set_progress("proj_1", "asr", progress=120, message="  ", metrics={"done": 3})
+
+    assert pool.conn.commits == 1
+    [(sql, params)] = pool.conn.executed
+    assert sql.lstrip().startswith("UPDATE stage_runs")
+    assert "SELECT" not in sql
+    assert "metadata->'metrics'" in sql
+    assert "WHERE project_id=%(project_id)s AND stage=%(stage)s" in sql
+    assert params["project_id"] == "proj_1"
+    assert params["stage"] == "asr"
+    assert isinstance(params["delta"], Jsonb)
+    assert params["delta"].obj == {"progress": 100, "progress_message": "running"}
+    assert isinstance(params["metrics"], Jsonb)
+    assert params["metrics"].obj == {"done": 3}
+
+
+@pytest.mark.asyncio
+async def test_set_progress_without_metrics_passes_null_metrics() -> None:
+    pool = _RecordingPool()
+    repo = StageRunRepository(pool)
+
+    await repo.set_progress("proj_1", "vad", progress=-5, message="working")
+
+    [(_sql, params)] = pool.conn.executed
+    assert params["delta"].obj == {"progress": 0, "progress_message": "working"}
+    assert params["metrics"] is None
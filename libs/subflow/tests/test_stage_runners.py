@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 import pytest
 
@@ -13,6 +16,7 @@ from subflow.models.segment import (
     TranslationChunk,
     VADSegment,
 )
+from subflow.pipeline import stage_runners
 from subflow.pipeline.stage_runners import (
     ASRRunner,
     AudioPreprocessRunner,
@@ -23,47 +27,15 @@ from subflow.pipeline.stage_runners import (
 from subflow.storage.artifact_store import ArtifactStore
 
 
-class InMemoryArtifactStore(ArtifactStore):
-    def __init__(self) -> None:
-        self.saved: list[tuple[str, str, str, bytes]] = []
-        self._data: dict[tuple[str, str, str], bytes] = {}
-
-    async def save(self, project_id: str, stage: str, name: str, data: bytes) -> str:
-        key = (str(project_id), str(stage), str(name))
-        payload = bytes(data)
-        self.saved.append((key[0], key[1], key[2], payload))
-        self._data[key] = payload
-        return f"mem://{project_id}/{stage}/{name}"
-
-    async def load(self, project_id: str, stage: str, name: str) -> bytes:
-        key = (str(project_id), str(stage), str(name))
-        if key not in self._data:
-            raise FileNotFoundError(name)
-        return self._data[key]
-
-    async def list(self, project_id: str, stage: str | None = None) -> list[str]:
-        return []
-
-    async def delete_project(self, project_id: str) -> int:
-        removed = 0
-        for key in list(self._data.keys()):
-            if key[0] == str(project_id):
-                removed += 1
-                self._data.pop(key, None)
-        return removed
-
-    async def list_project_ids(self) -> list[str]:
-        return sorted({pid for (pid, _st, _name) in self._data.keys()})
-
-
 class _FakeVADRepo:
     def __init__(self) -> None:
         self.deleted: list[str] = []
         self.inserted: dict[str, list[VADSegment]] = {}
 
     async def delete_by_project(self, project_id: str) -> None:
-        self.deleted.append(str(project_id))
-        self.inserted.pop(str(project_id), None)
+        pid = str(project_id)
+        self.deleted.append(pid)
+        self.inserted.pop(pid, None)
 
     async def bulk_insert(self, project_id: str, segments: list[VADSegment]) -> None:
         self.inserted[str(project_id)] = list(segments)
@@ -76,17 +48,19 @@ class _FakeASRRepo:
         self.corrected: dict[str, dict[int, str]] = {}
 
     async def delete_by_project(self, project_id: str) -> None:
-        self.deleted.append(str(project_id))
-        self.inserted.pop(str(project_id), None)
-        self.corrected.pop(str(project_id), None)
+        pid = str(project_id)
+        self.deleted.append(pid)
+        self.inserted.pop(pid, None)
+        self.corrected.pop(pid, None)
 
     async def bulk_insert(self, project_id: str, segments: list[ASRSegment]) -> None:
         self.inserted[str(project_id)] = list(segments)
 
     async def update_corrected_texts(self, project_id: str, corrections: dict[int, str]) -> None:
-        self.corrected[str(project_id)] = {
-            int(k): str(v) for k, v in dict(corrections or {}).items()
-        }
+        corrections = corrections or {}
+        self.corrected[str(project_id)] = dict(
+            zip(map(int, corrections), map(str, corrections.values()), strict=True)
+        )
 
 
 class _FakeGlobalContextRepo:
@@ -95,11 +69,12 @@ class _FakeGlobalContextRepo:
         self.saved: dict[str, dict] = {}
 
     async def delete(self, project_id: str) -> None:
-        self.deleted.append(str(project_id))
-        self.saved.pop(str(project_id), None)
+        pid = str(project_id)
+        self.deleted.append(pid)
+        self.saved.pop(pid, None)
 
     async def save(self, project_id: str, context: dict) -> None:
-        self.saved[str(project_id)] = dict(context)
+        self.saved[str(project_id)] = context.copy()
 
 
 class _FakeSemanticChunkRepo:
@@ -108,8 +83,9 @@ class _FakeSemanticChunkRepo:
         self.saved: dict[str, list[SemanticChunk]] = {}
 
     async def delete_by_project(self, project_id: str) -> None:
-        self.deleted.append(str(project_id))
-        self.saved.pop(str(project_id), None)
+        pid = str(project_id)
+        self.deleted.append(pid)
+        self.saved.pop(pid, None)
 
     async def bulk_insert(self, project_id: str, chunks: list[SemanticChunk]) -> list[int]:
         self.saved[str(project_id)] = list(chunks)
@@ -121,7 +97,7 @@ class _FakeProjectRepo:
         self.media_files: dict[str, dict[str, object]] = {}
 
     async def update_media_files(self, project_id: str, media_files: dict[str, object]) -> None:
-        self.media_files[str(project_id)] = dict(media_files or {})
+        self.media_files[str(project_id)] = media_files.copy() if media_files else {}
 
 
 class _FakeASRMergedChunkRepo:
@@ -130,41 +106,73 @@ class _FakeASRMergedChunkRepo:
         self.upserted: dict[str, list[ASRMergedChunk]] = {}
 
     async def delete_by_project(self, project_id: str) -> None:
-        self.deleted.append(str(project_id))
-        self.upserted.pop(str(project_id), None)
+        pid = str(project_id)
+        self.deleted.append(pid)
+        self.upserted.pop(pid, None)
 
     async def bulk_upsert(self, project_id: str, chunks: list[ASRMergedChunk]) -> None:
         self.upserted[str(project_id)] = list(chunks)
 
 
-@dataclass
+class _Repos:
+    """Fresh fakes for a single test."""
+
+    def __init__(self, store: ArtifactStore) -> None:
+        self.store = store
+        self.project_repo = _FakeProjectRepo()
+        self.vad_repo = _FakeVADRepo()
+        self.asr_repo = _FakeASRRepo()
+        self.asr_merged_chunk_repo = _FakeASRMergedChunkRepo()
+        self.global_context_repo = _FakeGlobalContextRepo()
+        self.semantic_chunk_repo = _FakeSemanticChunkRepo()
+
+
+@pytest.fixture
+def repos(memory_store: ArtifactStore) -> _Repos:
+    return _Repos(memory_store)
+
+
+@pytest.fixture
+def patch_stages(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Replace stage classes on ``subflow.pipeline.stage_runners`` by name."""
+
+    def _patch(**factories: Any) -> None:
+        for name, factory in factories.items():
+            monkeypatch.setattr(stage_runners, name, factory)
+
+    return _patch
+
+
+@dataclass(slots=True)
 class _FakeStage:
     ctx_update: dict
     closed: bool = False
 
     async def execute(self, ctx, progress_reporter=None):
-        return {**dict(ctx), **self.ctx_update}
+        out = ctx.copy()
+        out.update(self.ctx_update)
+        return out
 
     async def close(self) -> None:
         self.closed = True
 
 
 @pytest.mark.asyncio
-async def test_audio_preprocess_runner_persists_media_files(settings, monkeypatch) -> None:
-    store = InMemoryArtifactStore()
+async def test_audio_preprocess_runner_persists_media_files(settings, patch_stages, repos) -> None:
+    store = repos.store
     runner = AudioPreprocessRunner()
     project = Project(id="p1", name="n", media_url="u", target_language="zh")
-    project_repo = _FakeProjectRepo()
-    vad_repo = _FakeVADRepo()
-    asr_repo = _FakeASRRepo()
-    asr_merged_chunk_repo = _FakeASRMergedChunkRepo()
-    global_context_repo = _FakeGlobalContextRepo()
-    semantic_chunk_repo = _FakeSemanticChunkRepo()
+    project_repo = repos.project_repo
+    vad_repo = repos.vad_repo
+    asr_repo = repos.asr_repo
+    asr_merged_chunk_repo = repos.asr_merged_chunk_repo
+    global_context_repo = repos.global_context_repo
+    semantic_chunk_repo = repos.semantic_chunk_repo
 
     stage = _FakeStage(
         {"video_path": "v.mp4", "audio_path": "a.wav", "vocals_audio_path": "vocals.wav"}
     )
-    monkeypatch.setattr("subflow.pipeline.stage_runners.AudioPreprocessStage", lambda _s: stage)
+    patch_stages(AudioPreprocessStage=lambda _s: stage)
 
     ctx, artifacts = await runner.run(
         settings=settings,
@@ -180,27 +188,27 @@ async def test_audio_preprocess_runner_persists_media_files(settings, monkeypatc
     )
     assert artifacts == {}
     assert ctx["audio_path"] == "a.wav"
-    assert store.saved == []
+    assert not store.saved
     assert "audio" in project_repo.media_files["p1"]
 
 
 @pytest.mark.asyncio
-async def test_vad_runner_persists_regions_to_repo(settings, monkeypatch) -> None:
-    store = InMemoryArtifactStore()
+async def test_vad_runner_persists_regions_to_repo(settings, patch_stages, repos) -> None:
+    store = repos.store
     runner = VADRunner()
     project = Project(id="p1", name="n", media_url="u", target_language="zh")
-    project_repo = _FakeProjectRepo()
-    vad_repo = _FakeVADRepo()
-    asr_repo = _FakeASRRepo()
-    asr_merged_chunk_repo = _FakeASRMergedChunkRepo()
-    global_context_repo = _FakeGlobalContextRepo()
-    semantic_chunk_repo = _FakeSemanticChunkRepo()
+    project_repo = repos.project_repo
+    vad_repo = repos.vad_repo
+    asr_repo = repos.asr_repo
+    asr_merged_chunk_repo = repos.asr_merged_chunk_repo
+    global_context_repo = repos.global_context_repo
+    semantic_chunk_repo = repos.semantic_chunk_repo
     stage = _FakeStage(
         {
             "vad_regions": [VADSegment(start=0.0, end=2.0)],
         }
     )
-    monkeypatch.setattr("subflow.pipeline.stage_runners.VADStage", lambda _s: stage)
+    patch_stages(VADStage=lambda _s: stage)
 
     _ctx, artifacts = await runner.run(
         settings=settings,
@@ -221,16 +229,51 @@ async def test_vad_runner_persists_regions_to_repo(settings, monkeypatch) -> Non
 
 
 @pytest.mark.asyncio
-async def test_asr_runner_persists_segments_transcript_and_merged(settings, monkeypatch) -> None:
-    store = InMemoryArtifactStore()
+async def test_vad_runner_keeps_concurrent_projects_apart(settings, patch_stages, repos) -> None:
+    patch_stages(VADStage=lambda _s: _FakeStage({}))
+    runner = VADRunner()
+    project_ids = [f"p{i}" for i in range(4)]
+
+    async with asyncio.TaskGroup() as tg:
+        for i, pid in enumerate(project_ids):
+            tg.create_task(
+                runner.run(
+                    settings=settings,
+                    store=repos.store,
+                    project_repo=repos.project_repo,
+                    vad_repo=repos.vad_repo,
+                    asr_repo=repos.asr_repo,
+                    asr_merged_chunk_repo=repos.asr_merged_chunk_repo,
+                    global_context_repo=repos.global_context_repo,
+                    semantic_chunk_repo=repos.semantic_chunk_repo,
+                    project=Project(id=pid, name="n", media_url="u", target_language="zh"),
+                    ctx={
+                        "vad_regions": [VADSegment(start=float(i), end=float(i + 1))],
+                        "vad_frame_probs": [0.5] * (i + 1),
+                        "vad_frame_hop_s": 0.02,
+                    },
+                )
+            )
+
+    for i, pid in enumerate(project_ids):
+        assert [r.start for r in repos.vad_repo.inserted[pid]] == [float(i)]
+        assert await repos.store.list(pid, "vad") == [f"mem://{pid}/vad/vad_frame_probs.bin"]
+    assert await repos.store.list_project_ids() == project_ids
+
+
+@pytest.mark.asyncio
+async def test_asr_runner_persists_segments_transcript_and_merged(
+    settings, patch_stages, repos
+) -> None:
+    store = repos.store
     runner = ASRRunner()
     project = Project(id="p1", name="n", media_url="u", target_language="zh")
-    project_repo = _FakeProjectRepo()
-    vad_repo = _FakeVADRepo()
-    asr_repo = _FakeASRRepo()
-    asr_merged_chunk_repo = _FakeASRMergedChunkRepo()
-    global_context_repo = _FakeGlobalContextRepo()
-    semantic_chunk_repo = _FakeSemanticChunkRepo()
+    project_repo = repos.project_repo
+    vad_repo = repos.vad_repo
+    asr_repo = repos.asr_repo
+    asr_merged_chunk_repo = repos.asr_merged_chunk_repo
+    global_context_repo = repos.global_context_repo
+    semantic_chunk_repo = repos.semantic_chunk_repo
     stage = _FakeStage(
         {
             "asr_segments": [ASRSegment(id=0, start=0.0, end=1.0, text="hi", language="en")],
@@ -242,7 +285,7 @@ async def test_asr_runner_persists_segments_transcript_and_merged(settings, monk
             ],
         }
     )
-    monkeypatch.setattr("subflow.pipeline.stage_runners.ASRStage", lambda _s: stage)
+    patch_stages(ASRStage=lambda _s: stage)
 
     _ctx, artifacts = await runner.run(
         settings=settings,
@@ -257,22 +300,24 @@ async def test_asr_runner_persists_segments_transcript_and_merged(settings, monk
         ctx={},
     )
     assert artifacts == {}
-    assert store.saved == []
+    assert not store.saved
     assert asr_repo.inserted["p1"][0].text == "hi"
     assert asr_merged_chunk_repo.upserted["p1"][0].text == "hi"
 
 
 @pytest.mark.asyncio
-async def test_llm_asr_correction_runner_persists_corrected_segments(settings, monkeypatch) -> None:
-    store = InMemoryArtifactStore()
+async def test_llm_asr_correction_runner_persists_corrected_segments(
+    settings, patch_stages, repos
+) -> None:
+    store = repos.store
     runner = LLMASRCorrectionRunner()
     project = Project(id="p1", name="n", media_url="u", target_language="zh")
-    project_repo = _FakeProjectRepo()
-    vad_repo = _FakeVADRepo()
-    asr_repo = _FakeASRRepo()
-    asr_merged_chunk_repo = _FakeASRMergedChunkRepo()
-    global_context_repo = _FakeGlobalContextRepo()
-    semantic_chunk_repo = _FakeSemanticChunkRepo()
+    project_repo = repos.project_repo
+    vad_repo = repos.vad_repo
+    asr_repo = repos.asr_repo
+    asr_merged_chunk_repo = repos.asr_merged_chunk_repo
+    global_context_repo = repos.global_context_repo
+    semantic_chunk_repo = repos.semantic_chunk_repo
     stage = _FakeStage(
         {
             "asr_corrected_segments": {
@@ -280,7 +325,7 @@ async def test_llm_asr_correction_runner_persists_corrected_segments(settings, m
             }
         }
     )
-    monkeypatch.setattr("subflow.pipeline.stage_runners.LLMASRCorrectionStage", lambda _s: stage)
+    patch_stages(LLMASRCorrectionStage=lambda _s: stage)
 
     _ctx, artifacts = await runner.run(
         settings=settings,
@@ -299,16 +344,16 @@ async def test_llm_asr_correction_runner_persists_corrected_segments(settings, m
 
 
 @pytest.mark.asyncio
-async def test_llm_runner_truncates_asr_segments(settings, monkeypatch) -> None:
-    store = InMemoryArtifactStore()
+async def test_llm_runner_truncates_asr_segments(settings, patch_stages, repos) -> None:
+    store = repos.store
     runner = LLMRunner()
     project = Project(id="p1", name="n", media_url="u", target_language="zh")
-    project_repo = _FakeProjectRepo()
-    vad_repo = _FakeVADRepo()
-    asr_repo = _FakeASRRepo()
-    asr_merged_chunk_repo = _FakeASRMergedChunkRepo()
-    global_context_repo = _FakeGlobalContextRepo()
-    semantic_chunk_repo = _FakeSemanticChunkRepo()
+    project_repo = repos.project_repo
+    vad_repo = repos.vad_repo
+    asr_repo = repos.asr_repo
+    asr_merged_chunk_repo = repos.asr_merged_chunk_repo
+    global_context_repo = repos.global_context_repo
+    semantic_chunk_repo = repos.semantic_chunk_repo
 
     settings.llm_limits.max_asr_segments = 1
 
@@ -320,14 +365,16 @@ async def test_llm_runner_truncates_asr_segments(settings, monkeypatch) -> None:
                     id=0,
                     text="a",
                     translation="甲",
-                    asr_segment_ids=[0],
+                    asr_segment_ids=(0,),
                     translation_chunks=[TranslationChunk(text="甲", segment_id=0)],
                 )
             ]
         }
     )
-    monkeypatch.setattr("subflow.pipeline.stage_runners.GlobalUnderstandingPass", lambda _s: stage1)
-    monkeypatch.setattr("subflow.pipeline.stage_runners.SemanticChunkingPass", lambda _s: stage2)
+    patch_stages(
+        GlobalUnderstandingPass=lambda _s: stage1,
+        SemanticChunkingPass=lambda _s: stage2,
+    )
 
     ctx_in = {
         "asr_segments": [
@@ -20,72 +20,89 @@ from subflow.models.subtitle_types import (
 )
 
 
-def _demo_entries() -> list[SubtitleEntry]:
+@pytest.fixture(scope="module")
+def exporter() -> SubtitleExporter:
+    """``SubtitleExporter`` is stateless, so one instance serves the whole module."""
+    return SubtitleExporter()
+
+
+@pytest.fixture(scope="module")
+def demo_entries() -> list[SubtitleEntry]:
+    """Two bilingual entries; read-only (exporters never mutate their input)."""
     return [
         SubtitleEntry(index=1, start=0.0, end=1.0, primary_text="甲", secondary_text="a"),
         SubtitleEntry(index=2, start=1.0, end=2.0, primary_text="乙", secondary_text="b"),
     ]
 
 
-def test_export_entries_validates_config() -> None:
-    exporter = SubtitleExporter()
+def test_export_entries_validates_config(
+    exporter: SubtitleExporter,
+    demo_entries: list[SubtitleEntry],
+) -> None:
     config = SubtitleExportConfig(
         format=SubtitleFormat.SRT, content=SubtitleContent.BOTH, primary_position="middle"
     )
     with pytest.raises(ValueError, match="primary_position"):
-        exporter.export_entries(_demo_entries(), config)
+        exporter.export_entries(demo_entries, config)
 
 
-def test_srt_export_contains_timestamps_and_lines() -> None:
-    exporter = SubtitleExporter()
+def test_srt_export_contains_timestamps_and_lines(
+    exporter: SubtitleExporter,
+    demo_entries: list[SubtitleEntry],
+) -> None:
     config = SubtitleExportConfig(
         format=SubtitleFormat.SRT, content=SubtitleContent.BOTH, primary_position="top"
     )
-    out = exporter.export_entries(_demo_entries(), config)
+    out = exporter.export_entries(demo_entries, config)
     assert "1\n" in out
     assert "00:00:00,000 --> 00:00:01,000" in out
     assert "甲" in out and "a" in out
 
 
-def test_vtt_export_has_header() -> None:
-    exporter = SubtitleExporter()
+def test_vtt_export_has_header(
+    exporter: SubtitleExporter,
+    demo_entries: list[SubtitleEntry],
+) -> None:
     config = SubtitleExportConfig(
         format=SubtitleFormat.VTT, content=SubtitleContent.BOTH, primary_position="top"
     )
-    out = exporter.export_entries(_demo_entries(), config)
+    out = exporter.export_entries(demo_entries, config)
     assert out.startswith("WEBVTT")
     assert "00:00:00.000 --> 00:00:01.000" in out
 
 
-def test_ass_export_contains_dialogue_lines() -> None:
-    exporter = SubtitleExporter()
+def test_ass_export_contains_dialogue_lines(
+    exporter: SubtitleExporter,
+    demo_entries: list[SubtitleEntry],
+) -> None:
     config = SubtitleExportConfig(
         format=SubtitleFormat.ASS, content=SubtitleContent.BOTH, primary_position="top"
     )
-    out = exporter.export_entries(_demo_entries(), config)
+    out = exporter.export_entries(demo_entries, config)
     assert "[V4+ Styles]" in out
     assert "Dialogue:" in out
 
 
-def test_json_export_is_valid_json() -> None:
-    exporter = SubtitleExporter()
+def test_json_export_is_valid_json(
+    exporter: SubtitleExporter,
+    demo_entries: list[SubtitleEntry],
+) -> None:
     config = SubtitleExportConfig(
         format=SubtitleFormat.JSON, content=SubtitleContent.BOTH, primary_position="top"
     )
-    out = exporter.export_entries(_demo_entries(), config)
+    out = exporter.export_entries(demo_entries, config)
     payload = json.loads(out)
     assert payload["version"] == "1.0"
     assert payload["entries"][0]["primary_text"] == "甲"
 
 
-def test_build_entries_uses_segment_translations_when_provided() -> None:
-    exporter = SubtitleExporter()
+def test_build_entries_uses_segment_translations_when_provided(exporter: SubtitleExporter) -> None:
     chunks = [
         SemanticChunk(
             id=0,
             text="a b",
             translation="全翻译",
-            asr_segment_ids=[0, 1],
+            asr_segment_ids=(0, 1),
             translation_chunks=[
                 TranslationChunk(text="甲", segment_id=0),
                 TranslationChunk(text="乙", segment_id=1),
@@ -111,14 +128,15 @@ def test_build_entries_uses_segment_translations_when_provided() -> None:
     assert [e.secondary_text for e in entries] == ["A", "b"]
 
 
-def test_build_entries_legacy_translation_chunks_override_chunk_translation() -> None:
-    exporter = SubtitleExporter()
+def test_build_entries_legacy_translation_chunks_override_chunk_translation(
+    exporter: SubtitleExporter,
+) -> None:
     chunks = [
         SemanticChunk(
             id=0,
             text="a b",
             translation="FULL",
-            asr_segment_ids=[0, 1],
+            asr_segment_ids=(0, 1),
             translation_chunks=[TranslationChunk(text="only0", segment_id=0)],
         )
     ]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from subflow.models.segment import ASRSegment
 from subflow.utils.translation_distributor import distribute_translation
 
@@ -13,13 +15,21 @@ def _segs(durations: list[float]) -> list[ASRSegment]:
     return out
 
 
-def test_distribute_translation_empty_translation_all_empty() -> None:
-    chunks = distribute_translation("   ", _segs([1.0, 1.0]))
+@pytest.fixture(scope="module")
+def two_equal_segs() -> tuple[ASRSegment, ...]:
+    """Two 1s segments; read-only (``distribute_translation`` never mutates its input)."""
+    return tuple(_segs([1.0, 1.0]))
+
+
+def test_distribute_translation_empty_translation_all_empty(
+    two_equal_segs: tuple[ASRSegment, ...],
+) -> None:
+    chunks = distribute_translation("   ", two_equal_segs)
     assert [c.text for c in chunks] == ["", ""]
 
 
 def test_distribute_translation_single_segment_full_text() -> None:
-    chunks = distribute_translation(" hello ", _segs([1.0])[:1])
+    chunks = distribute_translation(" hello ", _segs([1.0]))
     assert len(chunks) == 1
     assert chunks[0].text == "hello"
 
@@ -37,11 +47,15 @@ def test_distribute_translation_more_segments_than_pieces_shares_last() -> None:
     assert [c.text for c in chunks] == ["A", "B", "B"]
 
 
-def test_distribute_translation_no_punctuation_cjk_even_split() -> None:
-    chunks = distribute_translation("甲乙丙丁", _segs([1.0, 1.0]))
+def test_distribute_translation_no_punctuation_cjk_even_split(
+    two_equal_segs: tuple[ASRSegment, ...],
+) -> None:
+    chunks = distribute_translation("甲乙丙丁", two_equal_segs)
     assert [c.text for c in chunks] == ["甲乙", "丙丁"]
 
 
-def test_distribute_translation_no_punctuation_words_even_split() -> None:
-    chunks = distribute_translation("one two three four", _segs([1.0, 1.0]))
+def test_distribute_translation_no_punctuation_words_even_split(
+    two_equal_segs: tuple[ASRSegment, ...],
+) -> None:
+    chunks = distribute_translation("one two three four", two_equal_segs)
     assert [c.text for c in chunks] == ["one two", "three four"]
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from array import array
+
+from subflow.utils.vad_frame_probs_io import decode_vad_frame_probs, encode_vad_frame_probs
+
+
+def test_vad_frame_probs_roundtrip() -> None:
+    probs = [0.0, 0.25, 0.5, 1.0]
+    payload = encode_vad_frame_probs(frame_probs=probs, frame_hop_s=0.02)
+
+    decoded, hop = decode_vad_frame_probs(payload)
+    assert hop == 0.02
+    assert decoded == array("f", probs)
+
+    from_view, _ = decode_vad_frame_probs(memoryview(bytearray(payload)))
+    assert from_view == decoded
+
+
+def test_vad_frame_probs_decode_rejects_bad_payloads() -> None:
+    assert decode_vad_frame_probs(b"") == (array("f"), 0.0)
+    assert decode_vad_frame_probs(b"x" * 64) == (array("f"), 0.0)
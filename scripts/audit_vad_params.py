@@ -10,12 +10,13 @@ Default input:
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
-import math
 from pathlib import Path
 
+import numpy as np
+
 from subflow.config import Settings
-from subflow.models.segment import VADSegment
 from subflow.providers import get_vad_provider
 
 
@@ -40,25 +41,14 @@ def _parse_args() -> argparse.Namespace:
     return p.parse_args()
 
 
-def _percentile(sorted_values: list[float], p: float) -> float:
-    if not sorted_values:
-        return 0.0
-    p = float(min(max(p, 0.0), 100.0))
-    if len(sorted_values) == 1:
-        return float(sorted_values[0])
-    k = (len(sorted_values) - 1) * (p / 100.0)
-    f = math.floor(k)
-    c = math.ceil(k)
-    if f == c:
-        return float(sorted_values[int(k)])
-    d0 = sorted_values[int(f)] * (c - k)
-    d1 = sorted_values[int(c)] * (k - f)
-    return float(d0 + d1)
-
-
-def _summarize(values: list[float]) -> dict[str, float]:
-    v = sorted(float(x) for x in values if x is not None)
-    if not v:
+def _dumps_json(obj: object) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _summarize(values: np.ndarray) -> dict[str, float]:
+    v = np.asarray(values, dtype=np.float64)
+    v = v[~np.isnan(v)]
+    if not v.size:
         return {
             "count": 0.0,
             "min": 0.0,
@@ -68,15 +58,15 @@ def _summarize(values: list[float]) -> dict[str, float]:
             "max": 0.0,
             "mean": 0.0,
         }
-    mean = sum(v) / float(len(v))
+    p50, p90, p95 = np.quantile(v, [0.5, 0.9, 0.95])
     return {
-        "count": float(len(v)),
-        "min": float(v[0]),
-        "p50": _percentile(v, 50.0),
-        "p90": _percentile(v, 90.0),
-        "p95": _percentile(v, 95.0),
-        "max": float(v[-1]),
-        "mean": float(mean),
+        "count": float(v.size),
+        "min": float(v.min()),
+        "p50": float(p50),
+        "p90": float(p90),
+        "p95": float(p95),
+        "max": float(v.max()),
+        "mean": float(v.mean()),
     }
 
 
@@ -95,7 +85,7 @@ def main() -> int:
 
     print("[1/3] VAD config", flush=True)
     print(
-        json.dumps(
+        _dumps_json(
             {
                 "provider": settings.vad.provider,
                 "threshold": settings.vad.threshold,
@@ -108,10 +98,8 @@ def main() -> int:
                 "split_gap_s": settings.vad.split_gap_s,
                 "nemo_device": settings.vad.nemo_device,
                 "nemo_model_path": str(settings.vad.nemo_model_path),
-            },
-            ensure_ascii=False,
-            indent=2,
-        ),
+            }
+        ).decode("utf-8"),
         flush=True,
     )
 
@@ -120,47 +108,44 @@ def main() -> int:
 
     # Prefer coarse regions (after merge + min_speech filtering).
     regions = getattr(vad_provider, "last_regions", None)
-    vad_regions = (
-        [VADSegment(start=float(s), end=float(e)) for s, e in regions]
-        if isinstance(regions, list) and regions
-        else [VADSegment(start=float(s), end=float(e)) for s, e in timestamps]
-    )
-    vad_regions.sort(key=lambda r: (float(r.start), float(r.end)))
+    source = regions if isinstance(regions, list) and regions else timestamps
+    # Coerce each bound once; tuples sort by (start, end) like the old key did.
+    pairs = sorted((float(s), float(e)) for s, e in source)
 
-    durations = [float(r.end) - float(r.start) for r in vad_regions if float(r.end) > float(r.start)]
-    gaps: list[float] = []
-    for a, b in zip(vad_regions, vad_regions[1:], strict=False):
-        g = float(b.start) - float(a.end)
-        if g > 0:
-            gaps.append(float(g))
+    bounds = np.array(pairs, dtype=np.float64).reshape(-1, 2)
+    starts, ends = bounds[:, 0], bounds[:, 1]
+    region_durations = ends - starts
+    all_gaps = starts[1:] - ends[:-1]
+    durations = region_durations[region_durations > 0]
+    gaps = all_gaps[all_gaps > 0]
 
     print("[3/3] stats", flush=True)
+    # torch.Tensor exposes numel(); lists / 1-D arrays fall back to len().
+    numel = getattr(frame_probs, "numel", None)
+    frame_probs_count = int(numel()) if callable(numel) else len(frame_probs)
     duration_stats = _summarize(durations)
     gap_stats = _summarize(gaps)
 
     out: dict[str, object] = {
         "audio": str(audio_path),
-        "regions_count": len(vad_regions),
+        "regions_count": len(pairs),
         "regions_duration_s": duration_stats,
         "gaps_s": gap_stats,
-        "frame_probs_count": int(getattr(frame_probs, "numel", lambda: len(frame_probs))()),
+        "frame_probs_count": frame_probs_count,
         "frame_hop_s": float(getattr(vad_provider, "frame_hop_s", 0.02)),
     }
 
-    print(json.dumps(out, ensure_ascii=False, indent=2), flush=True)
+    out_json = _dumps_json(out)
+    print(out_json.decode("utf-8"), flush=True)
 
     top = max(0, int(args.top))
     if top > 0:
-        longest_regions = sorted(
-            [(i, float(r.start), float(r.end), float(r.end) - float(r.start)) for i, r in enumerate(vad_regions)],
+        longest_regions = heapq.nlargest(
+            top,
+            zip(range(len(pairs)), starts.tolist(), ends.tolist(), region_durations.tolist()),
             key=lambda t: t[3],
-            reverse=True,
-        )[:top]
-        longest_gaps = sorted(
-            [(i, float(g)) for i, g in enumerate(gaps)],
-            key=lambda t: t[1],
-            reverse=True,
-        )[:top]
+        )
+        longest_gaps = heapq.nlargest(top, enumerate(gaps.tolist()), key=lambda t: t[1])
         print("\nTop regions (id, start, end, dur_s):", flush=True)
         for rid, s, e, d in longest_regions:
             print(f"  - {rid:04d} {s:8.2f} {e:8.2f}  dur={d:6.2f}s", flush=True)
@@ -171,7 +156,7 @@ def main() -> int:
     if args.json_out:
         out_path = Path(args.json_out)
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(json.dumps(out, ensure_ascii=False, indent=2), encoding="utf-8")
+        out_path.write_bytes(out_json)
         print(f"\nWrote: {out_path}", flush=True)
 
     return 0
@@ -6,36 +6,69 @@ from __future__ import annotations
 import argparse
 import asyncio
 
+try:
+    import uvloop
+except ImportError:  # optional; the default asyncio event loop is used otherwise
+    uvloop = None  # type: ignore[assignment]
+
 from subflow.config import Settings
 from subflow.repositories import DatabasePool, ProjectRepository
 from subflow.storage import get_artifact_store
 
+_ID_BATCH_SIZE = 1000
+
 
-async def _run(*, dry_run: bool) -> None:
+async def _run(*, dry_run: bool, concurrency: int) -> None:
     settings = Settings()
     pool = await DatabasePool.get_pool(settings)
     try:
         project_repo = ProjectRepository(pool)
         store = get_artifact_store(settings)
 
-        db_project_ids = set(await project_repo.list_all_ids())
-        store_project_ids = set(await store.list_project_ids())
-        orphan_ids = sorted(store_project_ids - db_project_ids)
+        # Ship store ids to Postgres in batches and let it anti-join against
+        # `projects`, so only orphan ids come back over the wire.
+        store_project_count = 0
+        orphan_ids: list[str] = []
+        batch: list[str] = []
+        async for project_id in store.iter_project_ids():
+            store_project_count += 1
+            batch.append(project_id)
+            if len(batch) >= _ID_BATCH_SIZE:
+                orphan_ids.extend(await project_repo.list_missing_ids(batch))
+                batch.clear()
+        orphan_ids.extend(await project_repo.list_missing_ids(batch))
+        orphan_ids.sort()
 
-        print(f"Database projects: {len(db_project_ids)}")
-        print(f"Store projects: {len(store_project_ids)}")
+        print(f"Store projects: {store_project_count}")
         print(f"Orphan projects: {len(orphan_ids)}")
 
         if not orphan_ids:
             print("No orphan artifacts to clean up.")
             return
 
-        for project_id in orphan_ids:
-            if dry_run:
+        if dry_run:
+            for project_id in orphan_ids:
                 print(f"[DRY-RUN] Would delete: {project_id}")
-                continue
-            deleted = await store.delete_project(project_id)
+            return
+
+        # Deletes are latency-bound round trips to the store; overlap a bounded number.
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _delete(project_id: str) -> None:
+            async with semaphore:
+                deleted = await store.delete_project(project_id)
             print(f"Deleted {project_id}: {deleted}")
+
+        results = await asyncio.gather(
+            *[_delete(project_id) for project_id in orphan_ids], return_exceptions=True
+        )
+        failed = 0
+        for project_id, result in zip(orphan_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                failed += 1
+                print(f"Failed {project_id}: {result!r}")
+        if failed:
+            raise SystemExit(f"{failed} of {len(orphan_ids)} project deletions failed")
     finally:
         await DatabasePool.close()
 
@@ -43,8 +76,16 @@ async def _run(*, dry_run: bool) -> None:
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--dry-run", action="store_true", help="Only list, don't delete")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=16,
+        help="Maximum number of project deletions in flight (default: 16)",
+    )
     args = parser.parse_args()
-    asyncio.run(_run(dry_run=bool(args.dry_run)))
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(_run(dry_run=bool(args.dry_run), concurrency=int(args.concurrency)))
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import psycopg
+from psycopg.rows import scalar_row
 
 from subflow.config import Settings
 
@@ -38,15 +39,16 @@ def _ensure_migrations_table(conn: psycopg.Connection) -> None:
 
 def _applied(conn: psycopg.Connection) -> set[str]:
     _ensure_migrations_table(conn)
-    rows = conn.execute("SELECT name FROM schema_migrations").fetchall()
-    return {str(r[0]) for r in rows}
+    with conn.cursor(row_factory=scalar_row) as cur:
+        return set(cur.execute("SELECT name FROM schema_migrations"))
 
 
-def _apply_one(conn: psycopg.Connection, name: str, sql: str) -> None:
+def _apply_one(conn: psycopg.Connection, name: str, sql: bytes, applied_at: datetime) -> None:
     conn.execute(sql)
     conn.execute(
         "INSERT INTO schema_migrations (name, applied_at) VALUES (%s, %s)",
-        (name, datetime.now(tz=timezone.utc)),
+        (name, applied_at),
+        prepare=True,
     )
 
 
@@ -62,18 +64,20 @@ def main() -> None:
     if not sql_files:
         raise SystemExit(f"no .sql migrations found in {migrations_dir}")
 
+    # Commit per file: migrations carry their own BEGIN/COMMIT, so a shared outer
+    # transaction could not roll earlier files back anyway.
     with psycopg.connect(database_url, autocommit=False) as conn:
         already = _applied(conn)
         for path in sql_files:
             name = path.name
             if name in already:
                 continue
-            sql = path.read_text(encoding="utf-8")
-            _apply_one(conn, name, sql)
+            # psycopg sends bytes queries as-is; skip the text decode round trip.
+            sql = path.read_bytes()
+            _apply_one(conn, name, sql, datetime.now(tz=timezone.utc))
             conn.commit()
             print(f"applied {name}")
 
-
 if __name__ == "__main__":
     main()
 
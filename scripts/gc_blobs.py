@@ -3,6 +3,11 @@ from __future__ import annotations
 import argparse
 import asyncio
 
+try:
+    import uvloop
+except ImportError:  # optional; the default asyncio event loop is used otherwise
+    uvloop = None  # type: ignore[assignment]
+
 from subflow.config import Settings
 from subflow.services import BlobStore
 
@@ -10,16 +15,35 @@ from subflow.services import BlobStore
 async def _main() -> int:
     parser = argparse.ArgumentParser(description="GC unreferenced blobs (ref_count=0).")
     parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument(
+        "--chunk",
+        type=int,
+        default=0,
+        help="Drain the whole backlog in batches of this size (default: single --limit pass)",
+    )
     parser.add_argument("--dry-run", action="store_true", default=False)
     args = parser.parse_args()
 
     settings = Settings()
     store = BlobStore(settings)
-    deleted = await store.gc_unreferenced(limit=int(args.limit), dry_run=bool(args.dry_run))
-    print(f"gc_unreferenced deleted={deleted} dry_run={bool(args.dry_run)}")
+    dry_run = bool(args.dry_run)
+    chunk = int(args.chunk)
+    if chunk <= 0 or dry_run:
+        # A dry run deletes nothing, so repeated batches would see the same rows.
+        deleted = await store.gc_unreferenced(limit=chunk or int(args.limit), dry_run=dry_run)
+    else:
+        deleted = 0
+        while True:
+            n = await store.gc_unreferenced(limit=chunk, dry_run=False)
+            deleted += n
+            if n < chunk:
+                break
+    print(f"gc_unreferenced deleted={deleted} dry_run={dry_run}")
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(asyncio.run(_main()))
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        raise SystemExit(runner.run(_main()))
 
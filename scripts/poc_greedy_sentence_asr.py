@@ -8,7 +8,7 @@ Input:
 
 Output (default: `data/poc_greedy_sentence_asr/`):
   - `vad_regions.json`
-  - `vad_frame_probs.pt`
+  - `vad_frame_probs.bin` (unless `--skip-frame-probs`)
   - `sentence_segments.json`
   - `output.srt`
   - `asr_segments.json`
@@ -24,9 +24,12 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import itertools
 import json
 import os
-from dataclasses import asdict
+import wave
+from collections.abc import Sequence
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 
 os.environ.setdefault("CUDA_VISIBLE_DEVICES", "1")
@@ -38,12 +41,19 @@ from subflow.models.segment import ASRMergedChunk, VADSegment
 from subflow.providers import get_asr_provider, get_vad_provider
 from subflow.stages.llm_asr_correction import LLMASRCorrectionStage
 from subflow.utils.audio import cut_audio_segment
+from subflow.utils.ffmpeg import resolve_ffmpeg_bin
 from subflow.utils.greedy_sentence_aligner import (
     GreedySentenceAlignerConfig,
     SentenceAlignedSegment,
     estimate_text_units,
+    frame_probs_as_array,
     greedy_sentence_align_region,
 )
+from subflow.utils.subprocess import run_subprocess
+from subflow.utils.vad_frame_probs_io import write_vad_frame_probs
+
+_SAMPLE_RATE = 16000
+_SAMPLE_WIDTH = 2  # s16le
 
 
 def _parse_args() -> argparse.Namespace:
@@ -96,35 +106,115 @@ def _parse_args() -> argparse.Namespace:
         help="Comma split threshold (CJK chars + Latin words)",
     )
     parser.add_argument("--min-segment-s", type=float, default=0.5, help="Minimum segment length")
+    parser.add_argument(
+        "--region-concurrency",
+        type=int,
+        default=4,
+        help="Max VAD regions aligned concurrently",
+    )
+    parser.add_argument(
+        "--asr-concurrency",
+        type=int,
+        default=8,
+        help="Max ASR requests in flight",
+    )
     parser.add_argument("--keep-chunks", action="store_true", help="Keep cut chunks for debugging")
     parser.add_argument("--skip-llm", action="store_true", help="Skip Stage 4 LLM correction")
+    parser.add_argument(
+        "--skip-frame-probs",
+        action="store_true",
+        help="Don't write vad_frame_probs.bin (probs are still used for alignment)",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print per-segment stats after alignment"
+    )
     return parser.parse_args()
 
 
-def _segments_to_srt(segments: list[SentenceAlignedSegment]) -> str:
-    lines: list[str] = []
-    for i, seg in enumerate(segments, 1):
-        lines.append(str(i))
-        lines.append(
-            f"{SubtitleFormatter.seconds_to_timestamp(float(seg.start), ',')} --> "
-            f"{SubtitleFormatter.seconds_to_timestamp(float(seg.end), ',')}"
-        )
-        lines.append((seg.text or "").strip())
-        lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
-
-
-def _asr_segments_to_srt(segments: list[ModelASRSegment]) -> str:
-    lines: list[str] = []
-    for i, seg in enumerate(segments, 1):
-        lines.append(str(i))
-        lines.append(
-            f"{SubtitleFormatter.seconds_to_timestamp(float(seg.start), ',')} --> "
-            f"{SubtitleFormatter.seconds_to_timestamp(float(seg.end), ',')}"
+def _json_default(obj: object) -> object:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(path: Path, obj: object) -> None:
+    """Write ``obj`` as indented UTF-8 JSON; dataclasses are serialised field by field."""
+    path.write_text(
+        json.dumps(obj, ensure_ascii=False, indent=2, default=_json_default), encoding="utf-8"
+    )
+
+
+def _read_pcm16_wav(input_path: str) -> bytes | None:
+    """Return raw frames when the input already is 16kHz mono s16 PCM WAV, else None."""
+    try:
+        with wave.open(input_path, "rb") as src:
+            if (
+                src.getnchannels() != 1
+                or src.getsampwidth() != _SAMPLE_WIDTH
+                or src.getframerate() != _SAMPLE_RATE
+                or src.getcomptype() != "NONE"
+            ):
+                return None
+            return src.readframes(src.getnframes())
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+async def _decode_pcm16(input_path: str, ffmpeg_bin: str) -> bytes:
+    """Decode the whole input once to 16kHz mono s16le PCM.
+
+    Inputs that already are 16kHz mono PCM WAV (the usual vocals file) are read
+    in-process; anything else goes through one ffmpeg -> stdout pipe.
+    """
+    pcm = await asyncio.to_thread(_read_pcm16_wav, input_path)
+    if pcm is not None:
+        return pcm
+    cmd = [
+        resolve_ffmpeg_bin(ffmpeg_bin),
+        "-v",
+        "error",
+        "-i",
+        input_path,
+        "-ar",
+        str(_SAMPLE_RATE),
+        "-ac",
+        "1",
+        "-f",
+        "s16le",
+        "-",
+    ]
+    result = await run_subprocess(cmd, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg decode failed (code={result.returncode}): {' '.join(cmd)}\n"
+            f"stderr: {result.stderr.decode(errors='ignore')}"
         )
-        lines.append((seg.text or "").strip())
-        lines.append("")
-    return "\n".join(lines).rstrip() + "\n"
+    return result.stdout
+
+
+def _write_wav_slice(pcm: bytes, output_path: Path, start: float, end: float) -> None:
+    """Write ``pcm[start:end]`` as a 16kHz mono WAV (same format as ``cut_audio_segment``)."""
+    if end <= start:
+        raise ValueError("end must be greater than start")
+    lo = min(len(pcm), int(round(start * _SAMPLE_RATE)) * _SAMPLE_WIDTH)
+    hi = min(len(pcm), int(round(end * _SAMPLE_RATE)) * _SAMPLE_WIDTH)
+    with wave.open(str(output_path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(_SAMPLE_WIDTH)
+        out.setframerate(_SAMPLE_RATE)
+        out.writeframes(memoryview(pcm)[lo:hi])
+
+
+def _segments_to_srt(segments: Sequence[SentenceAlignedSegment | ModelASRSegment]) -> str:
+    ts = SubtitleFormatter.seconds_to_timestamp
+    return (
+        "\n".join(
+            f"{i}\n{ts(float(seg.start), ',')} --> {ts(float(seg.end), ',')}\n"
+            f"{(seg.text or '').strip()}\n"
+            for i, seg in enumerate(segments, 1)
+        ).rstrip()
+        + "\n"
+    )
 
 
 def _build_merged_chunks(
@@ -138,40 +228,30 @@ def _build_merged_chunks(
 
     chunks: list[ASRMergedChunk] = []
     next_chunk_id_by_region: dict[int, int] = {}
+    max_chunk_s = float(max_chunk_s)
 
     cur: ASRMergedChunk | None = None
-    for seg, region_id in zip(asr_segments, segment_region_ids, strict=True):
-        if cur is None:
-            chunk_id = next_chunk_id_by_region.get(int(region_id), 0)
-            next_chunk_id_by_region[int(region_id)] = chunk_id + 1
-            cur = ASRMergedChunk(
-                region_id=int(region_id),
-                chunk_id=int(chunk_id),
-                start=float(seg.start),
-                end=float(seg.end),
-                segment_ids=[int(seg.id)],
-                text="",
-            )
+    for seg, raw_region_id in zip(asr_segments, segment_region_ids, strict=True):
+        region_id = int(raw_region_id)
+        start, end = float(seg.start), float(seg.end)
+        # The cap is measured from the current chunk's start, so this stays a single greedy pass.
+        if cur is not None and region_id == cur.region_id and end - cur.start <= max_chunk_s:
+            cur.end = end
+            cur.segment_ids.append(int(seg.id))
             continue
 
-        new_region = int(region_id) != int(cur.region_id)
-        new_duration = float(seg.end) - float(cur.start)
-        if new_region or (new_duration > float(max_chunk_s)):
+        if cur is not None:
             chunks.append(cur)
-            chunk_id = next_chunk_id_by_region.get(int(region_id), 0)
-            next_chunk_id_by_region[int(region_id)] = chunk_id + 1
-            cur = ASRMergedChunk(
-                region_id=int(region_id),
-                chunk_id=int(chunk_id),
-                start=float(seg.start),
-                end=float(seg.end),
-                segment_ids=[int(seg.id)],
-                text="",
-            )
-            continue
-
-        cur.end = float(seg.end)
-        cur.segment_ids.append(int(seg.id))
+        chunk_id = next_chunk_id_by_region.get(region_id, 0)
+        next_chunk_id_by_region[region_id] = chunk_id + 1
+        cur = ASRMergedChunk(
+            region_id=region_id,
+            chunk_id=chunk_id,
+            start=start,
+            end=end,
+            segment_ids=[int(seg.id)],
+            text="",
+        )
 
     if cur is not None:
         chunks.append(cur)
@@ -205,12 +285,16 @@ async def _run() -> int:
     if args.duration_s is not None and float(args.duration_s) > 0:
         tmp_audio_path = output_dir / ".tmp_input_trimmed.wav"
         print(f"[1/6] trim audio: {input_audio} -> {tmp_audio_path}", flush=True)
-        await cut_audio_segment(
-            input_path=str(input_audio),
-            output_path=str(tmp_audio_path),
-            start=0.0,
-            end=float(args.duration_s),
-            ffmpeg_bin=ffmpeg_bin,
+        # Load VAD weights while ffmpeg trims; both are cold-start costs.
+        await asyncio.gather(
+            cut_audio_segment(
+                input_path=str(input_audio),
+                output_path=str(tmp_audio_path),
+                start=0.0,
+                end=float(args.duration_s),
+                ffmpeg_bin=ffmpeg_bin,
+            ),
+            asyncio.to_thread(vad_provider.warmup),
         )
         vocals_path = str(tmp_audio_path)
     else:
@@ -222,49 +306,85 @@ async def _run() -> int:
 
     print(f"[2/6] VAD detect_with_probs: {vocals_path}", flush=True)
     regions, frame_probs = vad_provider.detect_with_probs(vocals_path)  # type: ignore[attr-defined]
+    frame_hop_s = float(getattr(vad_provider, "frame_hop_s", 0.02))
+    # Probs come back as a CPU tensor; free the VAD weights before ASR/LLM run.
+    await vad_provider.close()
     regions_json = [{"start": float(s), "end": float(e)} for s, e in regions]
-    (output_dir / "vad_regions.json").write_text(
-        json.dumps(regions_json, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-
-    import torch
+    _dump_json(output_dir / "vad_regions.json", regions_json)
 
-    torch.save(frame_probs, str(output_dir / "vad_frame_probs.pt"))
+    # Same float32 format as the pipeline's `vad_frame_probs.bin` artifact
+    # (read back with `decode_vad_frame_probs`); no torch pickle involved.
+    if not args.skip_frame_probs:
+        with (output_dir / "vad_frame_probs.bin").open("wb") as fp:
+            write_vad_frame_probs(fp, frame_probs=frame_probs, frame_hop_s=frame_hop_s)
 
     chunk_dir = output_dir / "chunks"
     if args.keep_chunks:
         chunk_dir.mkdir(parents=True, exist_ok=True)
 
-    chunk_index = 0
+    # Decode once and slice windows in memory instead of spawning ffmpeg per window.
+    vocals_pcm = await _decode_pcm16(vocals_path, ffmpeg_bin)
 
-    async def _transcribe_window(start: float, end: float) -> str:
-        nonlocal chunk_index
-        chunk_index += 1
+    # Shared by concurrently aligned regions, so chunk filenames stay unique.
+    chunk_counter = itertools.count(1)
 
+    async def _cut_window(start: float, end: float) -> Path:
+        chunk_index = next(chunk_counter)
         if args.keep_chunks:
             chunk_path = chunk_dir / f"chunk_{chunk_index:05d}_{start:.2f}_{end:.2f}.wav"
         else:
             chunk_path = output_dir / f".tmp_chunk_{chunk_index:05d}.wav"
 
-        await cut_audio_segment(
-            input_path=vocals_path,
-            output_path=str(chunk_path),
-            start=float(start),
-            end=float(end),
-            ffmpeg_bin=ffmpeg_bin,
+        _write_wav_slice(vocals_pcm, chunk_path, float(start), float(end))
+        return chunk_path
+
+    def _discard_chunk(chunk_path: Path) -> None:
+        if (not args.keep_chunks) and chunk_path.exists():
+            try:
+                os.remove(chunk_path)
+            except OSError:
+                pass
+
+    asr_semaphore = asyncio.Semaphore(max(1, int(args.asr_concurrency)))
+
+    async def _transcribe_uncached(start: float, end: float) -> str:
+        # Cut inside the semaphore so at most --asr-concurrency slices exist on disk.
+        async with asr_semaphore:
+            chunk_path = await _cut_window(start, end)
+            try:
+                text = await asr_provider.transcribe_segment(
+                    str(chunk_path), float(start), float(end)
+                )
+                return text.strip()
+            finally:
+                _discard_chunk(chunk_path)
+
+    # Stages 3-5 re-probe identical windows; memoise per (start, end) and share
+    # in-flight tasks so concurrent duplicates cost one ASR call. Failures are evicted.
+    transcripts: dict[tuple[float, float], asyncio.Future[str]] = {}
+
+    def _window_key(start: float, end: float) -> tuple[float, float]:
+        return (round(float(start), 3), round(float(end), 3))
+
+    def _remember(key: tuple[float, float], fut: asyncio.Future[str]) -> asyncio.Future[str]:
+        def _evict_on_error(done: asyncio.Future[str]) -> None:
+            if (done.cancelled() or done.exception() is not None) and transcripts.get(key) is done:
+                del transcripts[key]
+
+        fut.add_done_callback(_evict_on_error)
+        transcripts[key] = fut
+        return fut
+
+    async def _transcribe_window(start: float, end: float) -> str:
+        key = _window_key(start, end)
+        fut = transcripts.get(key) or _remember(
+            key, asyncio.ensure_future(_transcribe_uncached(start, end))
         )
-        try:
-            text = await asr_provider.transcribe_segment(str(chunk_path), float(start), float(end))
-            return text.strip()
-        finally:
-            if (not args.keep_chunks) and chunk_path.exists():
-                try:
-                    os.remove(chunk_path)
-                except OSError:
-                    pass
+        return await fut
+
+    async def _transcribe_windows(windows: list[tuple[float, float]]) -> list[str]:
+        return list(await asyncio.gather(*[_transcribe_window(s, e) for s, e in windows]))
 
-    frame_hop_s = float(getattr(vad_provider, "frame_hop_s", 0.02))
     cfg = GreedySentenceAlignerConfig(
         max_chunk_s=float(args.max_chunk_s),
         max_segment_s=float(args.max_segment_s),
@@ -275,57 +395,60 @@ async def _run() -> int:
     )
 
     print(f"[3/6] greedy align (regions={len(regions)})", flush=True)
+    region_semaphore = asyncio.Semaphore(max(1, int(args.region_concurrency)))
+    align_probs = frame_probs_as_array(frame_probs)  # convert the tensor once for all regions
+
+    async def _align_region(region_start: float, region_end: float) -> list[SentenceAlignedSegment]:
+        async with region_semaphore:
+            return await greedy_sentence_align_region(
+                _transcribe_window,
+                frame_probs=align_probs,
+                frame_hop_s=frame_hop_s,
+                region_start=float(region_start),
+                region_end=float(region_end),
+                config=cfg,
+            )
+
+    # Regions are independent; overlap their ffmpeg cuts and ASR calls. gather keeps
+    # results in region order.
+    region_segments = await asyncio.gather(*[_align_region(s, e) for s, e in regions])
     sentence_segments: list[SentenceAlignedSegment] = []
     sentence_segment_region_ids: list[int] = []
-    for region_id, (region_start, region_end) in enumerate(regions):
-        segs = await greedy_sentence_align_region(
-            _transcribe_window,
-            frame_probs=frame_probs,
-            frame_hop_s=frame_hop_s,
-            region_start=float(region_start),
-            region_end=float(region_end),
-            config=cfg,
-        )
+    for region_id, segs in enumerate(region_segments):
         sentence_segments.extend(segs)
         sentence_segment_region_ids.extend([int(region_id)] * len(segs))
 
-    endings_sentence = set(str(cfg.sentence_endings))
-    endings_clause = set(str(cfg.clause_endings))
-    print("\nSegment stats (idx start end dur_s units comma_split):", flush=True)
-    for i, seg in enumerate(sentence_segments):
-        txt = (seg.text or "").strip()
-        comma_split = bool(txt) and (txt[-1] in endings_clause) and (txt[-1] not in endings_sentence)
-        units = estimate_text_units(txt)
-        dur = float(seg.end) - float(seg.start)
-        print(
-            f"  - {i:04d} {float(seg.start):8.2f} {float(seg.end):8.2f}  dur={dur:6.2f}s  "
-            f"units={units:3d}  comma_split={'y' if comma_split else 'n'}",
-            flush=True,
-        )
+    if args.verbose:
+        endings_sentence = set(str(cfg.sentence_endings))
+        endings_clause = set(str(cfg.clause_endings))
+        rows = ["\nSegment stats (idx start end dur_s units comma_split):"]
+        for i, seg in enumerate(sentence_segments):
+            txt = (seg.text or "").strip()
+            comma_split = (
+                bool(txt) and (txt[-1] in endings_clause) and (txt[-1] not in endings_sentence)
+            )
+            units = estimate_text_units(txt)
+            dur = float(seg.end) - float(seg.start)
+            rows.append(
+                f"  - {i:04d} {float(seg.start):8.2f} {float(seg.end):8.2f}  dur={dur:6.2f}s  "
+                f"units={units:3d}  comma_split={'y' if comma_split else 'n'}"
+            )
+        # One write instead of a flushed print per segment.
+        print("\n".join(rows), flush=True)
 
-    (output_dir / "sentence_segments.json").write_text(
-        json.dumps([asdict(s) for s in sentence_segments], ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    _dump_json(output_dir / "sentence_segments.json", sentence_segments)
     (output_dir / "output.srt").write_text(_segments_to_srt(sentence_segments), encoding="utf-8")
 
     print(f"[4/6] segmented ASR (segments={len(sentence_segments)})", flush=True)
-    asr_segments: list[ModelASRSegment] = []
-    for i, seg in enumerate(sentence_segments):
-        text = await _transcribe_window(float(seg.start), float(seg.end))
-        asr_segments.append(
-            ModelASRSegment(
-                id=int(i),
-                start=float(seg.start),
-                end=float(seg.end),
-                text=str(text or "").strip(),
-            )
-        )
-
-    (output_dir / "asr_segments.json").write_text(
-        json.dumps([asdict(s) for s in asr_segments], ensure_ascii=False, indent=2),
-        encoding="utf-8",
+    segment_texts = await _transcribe_windows(
+        [(float(seg.start), float(seg.end)) for seg in sentence_segments]
     )
+    asr_segments: list[ModelASRSegment] = [
+        ModelASRSegment(id=int(i), start=float(seg.start), end=float(seg.end), text=text)
+        for i, (seg, text) in enumerate(zip(sentence_segments, segment_texts, strict=True))
+    ]
+
+    _dump_json(output_dir / "asr_segments.json", asr_segments)
 
     print(f"[5/6] merged ASR (max_chunk_s={float(args.merged_max_chunk_s):.2f})", flush=True)
     merged_chunks = _build_merged_chunks(
@@ -333,13 +456,13 @@ async def _run() -> int:
         segment_region_ids=sentence_segment_region_ids,
         max_chunk_s=float(args.merged_max_chunk_s),
     )
-    for chunk in merged_chunks:
-        chunk.text = await _transcribe_window(float(chunk.start), float(chunk.end))
-
-    (output_dir / "asr_merged_chunks.json").write_text(
-        json.dumps([asdict(c) for c in merged_chunks], ensure_ascii=False, indent=2),
-        encoding="utf-8",
+    merged_texts = await _transcribe_windows(
+        [(float(chunk.start), float(chunk.end)) for chunk in merged_chunks]
     )
+    for chunk, text in zip(merged_chunks, merged_texts, strict=True):
+        chunk.text = text
+
+    _dump_json(output_dir / "asr_merged_chunks.json", merged_chunks)
 
     if args.skip_llm:
         print("[6/6] skip llm correction", flush=True)
@@ -367,14 +490,10 @@ async def _run() -> int:
             finally:
                 await stage.close()
 
-    (output_dir / "asr_corrected_segments.json").write_text(
-        json.dumps([asdict(s) for s in asr_segments], ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    (output_dir / "output_corrected.srt").write_text(_asr_segments_to_srt(asr_segments), encoding="utf-8")
+    _dump_json(output_dir / "asr_corrected_segments.json", asr_segments)
+    (output_dir / "output_corrected.srt").write_text(_segments_to_srt(asr_segments), encoding="utf-8")
 
     await asr_provider.close()
-    await vad_provider.close()
 
     if tmp_audio_path is not None and tmp_audio_path.exists():
         try: